@@ -1,145 +1,50 @@
 """
 Main application class for SkyTouch.
 """
-import time
+import sys
 
-from core.hand_tracking.detector import HandDetector
-from core.gesture.detector import GestureDetector
-from core.mouse.controller import MouseController
-from core.camera.capture import CameraCapture
-from config.manager import ConfigManager
+from core.app_base import TrackingApp
 from utils.logging.logger import get_logger
 from exceptions.base import HandTrackpadError
-import sys
-from PyQt5.QtWidgets import QApplication
-from ui.main_window.pyqt_main_window import IOSMainWindow
 
 logger = get_logger(__name__)
 
 
-class SkyTouchApp:
-    """SkyTouch 메인 애플리케이션 클래스"""
+class SkyTouchApp(TrackingApp):
+    """SkyTouch 메인 애플리케이션 클래스 (PyQt5 UI)"""
     
     def __init__(self):
         """애플리케이션 초기화"""
-        try:
-            logger.info("SkyTouch 애플리케이션을 시작합니다.")
-            
-            # 설정 관리자 초기화
-            self.config_manager = ConfigManager()
-            
-            # 핵심 컴포넌트 초기화
-            self.camera_capture = None
-            self.hand_detector = None
-            self.gesture_detector = None
-            self.mouse_controller = None
-            self.main_window = None
-            
-            # 트래킹 상태
-            self.tracking_active = False
-            
-            # 컴포넌트 초기화
-            self.initialize_components()
-            
-            logger.info("애플리케이션이 성공적으로 초기화되었습니다.")
-            
-        except Exception as e:
-            logger.error(f"애플리케이션 초기화 실패: {e}")
-            raise HandTrackpadError(f"애플리케이션 초기화 실패: {e}")
+        self.qt_app = None
+        self.main_window = None
+        super().__init__()
     
-    def initialize_components(self) -> None:
-        """컴포넌트 초기화"""
-        try:
-            # 카메라 캡처 초기화
-            camera_config = self.config_manager.get_camera_config()
-            self.camera_capture = CameraCapture(camera_config)
-            self.hand_detector = HandDetector(self.config_manager.get_hand_tracking_config())
-            self.gesture_detector = GestureDetector(self.config_manager.get_gesture_config())
-            self.mouse_controller = MouseController(self.camera_capture, self.config_manager)
-            
-            # QApplication 인스턴스 가져오기 (이미 생성되어 있음)
-            self.qt_app = QApplication.instance()
-            if not self.qt_app:
-                self.qt_app = QApplication(sys.argv)
-            
-            self.main_window = IOSMainWindow(self)
-            
-            logger.info("모든 컴포넌트가 초기화되었습니다.")
-            
-        except Exception as e:
-            logger.error(f"컴포넌트 초기화 실패: {e}")
-            raise
+    def _create_ui(self) -> None:
+        """PyQt5 메인 윈도우 생성 (Qt는 UI를 만들 때만 import)"""
+        from PyQt5.QtWidgets import QApplication
+        from ui.main_window.pyqt_main_window import IOSMainWindow
+        
+        # QApplication 인스턴스 가져오기 (이미 생성되어 있음)
+        self.qt_app = QApplication.instance()
+        if not self.qt_app:
+            self.qt_app = QApplication(sys.argv)
+        
+        self.main_window = IOSMainWindow(self)
     
-    def tracking_loop(self) -> None:
-        """손 트래킹 메인 루프"""
-        try:
-            logger.info("손 트래킹 루프를 시작합니다.")
-            
-            while self.tracking_active:
-                # CPU 사용량 조절
-                time.sleep(0.01)
-                
-                # 트래킹 상태 확인
-                if not self.tracking_active:
-                    break
-                
-            logger.info("손 트래킹 루프가 종료되었습니다.")
-                
-        except Exception as e:
-            logger.error(f"손 트래킹 루프 중 오류: {e}")
-            if self.main_window:
-                self.main_window.set_error_status(str(e))
-        finally:
-            # 리소스 정리
-            if self.hand_detector:
-                self.hand_detector = None
+    def _on_tracking_started(self) -> None:
+        """카메라 패널 표시 시작"""
+        if self.main_window and self.main_window.camera_panel:
+            self.main_window.camera_panel.start_display()
     
-    def start_tracking(self) -> None:
-        """트래킹 시작"""
-        try:
-            if self.tracking_active:
-                logger.warning("트래킹이 이미 실행 중입니다.")
-                return
-                
-            # 카메라가 열려있지 않다면 열기
-            if not self.camera_capture.is_opened():
-                # 최신 설정으로 카메라 초기화
-                camera_config = self.config_manager.get_camera_config()
-                self.camera_capture.config = camera_config  # 설정 업데이트
-                self.camera_capture._init_camera()
-                logger.info(f"카메라가 열렸습니다. (해상도: {camera_config.get('width')}x{camera_config.get('height')}, FPS: {camera_config.get('fps')})")
-            
-            # 상태를 먼저 설정하여 중복 실행 방지
-            self.tracking_active = True
-            
-            # 카메라 패널 시작
-            if self.main_window and self.main_window.camera_panel:
-                self.main_window.camera_panel.start_display()
-            logger.info("트래킹이 시작되었습니다.")
-            
-        except Exception as e:
-            logger.error(f"트래킹 시작 실패: {e}")
-            self.tracking_active = False  # 실패 시 상태 초기화
-            raise
+    def _on_tracking_stopped(self) -> None:
+        """카메라 패널 표시 정지"""
+        if self.main_window and self.main_window.camera_panel:
+            self.main_window.camera_panel.stop_display()
     
-    def stop_tracking(self) -> None:
-        """트래킹 정지"""
-        try:
-            if not self.tracking_active:
-                logger.warning("트래킹이 이미 정지된 상태입니다.")
-                return
-                
-            # 상태를 먼저 설정하여 중복 실행 방지
-            self.tracking_active = False
-            
-            # 카메라 패널 정지 (카메라 해제는 패널에서 처리)
-            if self.main_window and self.main_window.camera_panel:
-                self.main_window.camera_panel.stop_display()
-            logger.info("트래킹이 정지되었습니다.")
-            
-        except Exception as e:
-            logger.error(f"트래킹 정지 실패: {e}")
-            raise
+    def _on_tracking_error(self, message: str) -> None:
+        """메인 윈도우에 오류 상태 표시"""
+        if self.main_window and hasattr(self.main_window, 'set_error_status'):
+            self.main_window.set_error_status(message)
     
     def run(self) -> None:
         """애플리케이션 실행"""
@@ -156,24 +61,3 @@ class SkyTouchApp:
             # 리소스 정리
             self.cleanup()
             logger.info("애플리케이션이 종료되었습니다.")
-    
-    def cleanup(self) -> None:
-        """리소스 정리"""
-        try:
-            if self.camera_capture:
-                self.camera_capture.release()
-            if self.hand_detector:
-                self.hand_detector.release()
-            if self.mouse_controller:
-                self.mouse_controller.cleanup()
-            logger.info("애플리케이션 리소스가 정리되었습니다.")
-            
-        except Exception as e:
-            logger.error(f"리소스 정리 중 오류: {e}") 
-
-    def get_camera_frame(self):
-        if self.camera_capture:
-            ret, frame = self.camera_capture.read()
-            if ret:
-                return frame
-        return None 
\ No newline at end of file
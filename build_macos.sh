@@ -5,6 +5,15 @@ echo "Building SkyTouch application..."
 # 의존성 설치
 pip install -r requirements.txt
 
+# 손 랜드마크 모델 다운로드 (없을 때만, SkyTouch.spec의 datas에 포함)
+MODEL_PATH="models/hand_landmarker.task"
+MODEL_URL="https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/hand_landmarker.task"
+if [ ! -f "$MODEL_PATH" ]; then
+    echo "Downloading hand landmarker model..."
+    mkdir -p models
+    curl -fL -o "$MODEL_PATH" "$MODEL_URL"
+fi
+
 # 기존 빌드 제거
 rm -rf build/
 rm -rf dist/
@@ -1,20 +1,32 @@
 """
 Default configuration values for Hand Tracking Trackpad application.
 """
+from types import MappingProxyType
 
-DEFAULT_CONFIG = {
+_DEFAULTS = {
     "camera": {
         "width": 480,
         "height": 360,
         "fps": 30,
         "device_id": 0,
-        "frame_delay": 0.03
+        "frame_delay": 0.03,
+        "idle_release_timeout": 30.0
     },
     "hand_tracking": {
         "max_num_hands": 1,
         "min_detection_confidence": 0.7,
         "min_tracking_confidence": 0.5,
-        "static_image_mode": False
+        "redetection_confidence": 0.5,
+        "static_image_mode": False,
+        "inference_size": (256, 192),
+        "use_opencl": True,
+        "model_asset_path": "models/hand_landmarker.task",
+        "delegate": "cpu",
+        "running_mode": "live_stream",
+        "draw_landmarks": True,
+        "draw_interval": 1,
+        "idle_detect_after": 1.0,
+        "idle_detect_interval": 3
     },
     "gesture": {
         "click_threshold": 0.12,
@@ -38,7 +50,8 @@ DEFAULT_CONFIG = {
         "invert_swipe_x": True,
         "invert_swipe_y": False,
         "double_click_time": 0.5,
-        "min_movement_threshold": 0.001
+        "min_movement_threshold": 0.001,
+        "move_rate_hz": 60
     },
     "ui": {
         "window_width": 520,
@@ -46,6 +59,12 @@ DEFAULT_CONFIG = {
         "theme": "clam",
         "font_family": "Arial",
         "title": "SkyTouch",
-        "debug_mode": True
+        "debug_mode": True,
+        "display_fps": 30
     }
-} 
\ No newline at end of file
+}
+
+# 읽기 전용 기본 설정 (실수로 기본값이 변경되는 것을 방지)
+DEFAULT_CONFIG = MappingProxyType({
+    section: MappingProxyType(values) for section, values in _DEFAULTS.items()
+})
@@ -3,48 +3,98 @@ Configuration manager for Hand Tracking Trackpad application.
 """
 import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Mapping
 
 from .defaults import DEFAULT_CONFIG
 from utils.logging.logger import get_logger
 from exceptions.base import ConfigError
 
+try:
+    import msgspec
+except ImportError:
+    # msgspec이 없으면 표준 json 모듈 사용
+    msgspec = None
+
 logger = get_logger(__name__)
 
+# 설정 파일 JSON 디코딩 오류 타입
+_DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError) if msgspec else (json.JSONDecodeError,)
+
+
+def _decode_json(data: bytes) -> Dict[str, Any]:
+    """설정 파일 내용 디코딩 (msgspec이 있으면 C 디코더 사용)"""
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def _encode_json(config: Dict[str, Any]) -> bytes:
+    """설정을 들여쓰기된 UTF-8 JSON으로 인코딩"""
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(config), indent=2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _copy_sections(config: Mapping[str, Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """섹션별 딕셔너리 복사 (설정값은 교체만 되고 제자리 수정되지 않으므로 얕은 복사로 충분)"""
+    return {section: dict(values) for section, values in config.items()}
+
+
+def _default_config() -> Dict[str, Dict[str, Any]]:
+    """수정 가능한 기본 설정 복사본 생성"""
+    return _copy_sections(DEFAULT_CONFIG)
+
 
 class ConfigManager:
     """설정 관리자"""
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = _default_config()
+        self._cache = {}
+        self._loaded_mtime = None  # 마지막으로 반영한 설정 파일 수정 시각 (ns)
         self.load_config()
     
     def load_config(self) -> None:
-        """설정 파일에서 설정 로드"""
-        if self.config_file.exists():
+        """설정 파일에서 설정 로드 (마지막 로드 이후 파일이 바뀌지 않았으면 생략)"""
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        
+        if mtime is not None:
+            if mtime == self._loaded_mtime:
+                logger.debug("설정 파일이 변경되지 않아 다시 로드하지 않습니다.")
+                return
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
+                file_config = _decode_json(self.config_file.read_bytes())
                 
                 # 각 설정 섹션 업데이트
                 for section in file_config:
                     if section in self.config:
                         self.config[section].update(file_config[section])
                 
+                self._loaded_mtime = mtime
                 logger.info(f"설정 파일을 로드했습니다: {self.config_file}")
                 
-            except (json.JSONDecodeError, KeyError) as e:
+            except _DECODE_ERRORS + (KeyError,) as e:
                 logger.error(f"설정 파일 로드 중 오류: {e}")
                 raise ConfigError(f"설정 파일 로드 실패: {e}")
         else:
             logger.info("설정 파일이 없어 기본 설정을 사용합니다.")
+        
+        self._refresh_cache()
+    
+    def _refresh_cache(self) -> None:
+        """섹션별 설정 딕셔너리 참조 캐시 갱신"""
+        self._cache = {section: self.config[section] for section in self.config}
     
     def save_config(self) -> None:
         """현재 설정을 파일에 저장"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.config_file.write_bytes(_encode_json(self.config))
+            # 방금 저장한 내용은 메모리 설정과 같으므로 다시 로드할 필요 없음
+            self._loaded_mtime = self.config_file.stat().st_mtime_ns
             
             logger.info(f"설정을 저장했습니다: {self.config_file}")
             
@@ -54,25 +104,25 @@ class ConfigManager:
     
     def get_camera_config(self) -> Dict[str, Any]:
         """카메라 설정 반환"""
-        return self.config.get('camera', DEFAULT_CONFIG['camera'])
+        return self._cache['camera']
     
     def get_hand_tracking_config(self) -> Dict[str, Any]:
         """손 트래킹 설정 반환"""
-        return self.config.get('hand_tracking', DEFAULT_CONFIG['hand_tracking'])
+        return self._cache['hand_tracking']
     
     def get_gesture_config(self) -> Dict[str, Any]:
         """제스처 설정 반환"""
-        return self.config.get('gesture', DEFAULT_CONFIG['gesture'])
+        return self._cache['gesture']
     
     def get_ui_config(self) -> Dict[str, Any]:
         """UI 설정 반환"""
-        return self.config.get('ui', DEFAULT_CONFIG['ui'])
+        return self._cache['ui']
     
     def update_config(self, section: str, key: str, value: Any) -> None:
         """설정 업데이트"""
         if section in self.config:
             self.config[section][key] = value
-            logger.debug(f"설정 업데이트: {section}.{key} = {value}")
+            logger.debug("설정 업데이트: %s.%s = %s", section, key, value)
         else:
             raise ConfigError(f"알 수 없는 설정 섹션: {section}")
     
@@ -80,7 +130,13 @@ class ConfigManager:
         """전체 설정 반환"""
         return self.config.copy()
     
+    def get_config_snapshot(self) -> Dict[str, Any]:
+        """이후 변경에 영향받지 않는 전체 설정 복사본 반환"""
+        return _copy_sections(self.config)
+    
     def reset_to_defaults(self) -> None:
         """기본 설정으로 초기화"""
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = _default_config()
+        self._loaded_mtime = None
+        self._refresh_cache()
         logger.info("설정을 기본값으로 초기화했습니다.") 
\ No newline at end of file
@@ -1,28 +1,42 @@
 """
 Core modules for Hand Tracking Trackpad application.
-"""
 
-from .hand_tracking import HandDetector, LandmarkProcessor, HandLandmarks, MediaPipeWrapper
-from .gesture import GestureDetector, GestureClassifier, GestureData, GestureType, FingerState, ThumbDistance
-from .mouse import MouseController, MouseState
-from .camera import CameraCapture
+무거운 의존성(MediaPipe, OpenCV, pyautogui)은 처음 접근할 때 import합니다.
+"""
+import importlib
 
-__all__ = [
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
     # Hand tracking
-    'HandDetector',
-    'LandmarkProcessor',
-    'HandLandmarks', 
-    'MediaPipeWrapper',
+    'HandDetector': '.hand_tracking',
+    'LandmarkProcessor': '.hand_tracking',
+    'HandLandmarks': '.hand_tracking',
+    'MediaPipeWrapper': '.hand_tracking',
     # Gesture
-    'GestureDetector',
-    'GestureClassifier',
-    'GestureData',
-    'GestureType',
-    'FingerState',
-    'ThumbDistance',
+    'GestureDetector': '.gesture',
+    'GestureClassifier': '.gesture',
+    'GestureData': '.gesture',
+    'GestureType': '.gesture',
+    'FingerState': '.gesture',
+    'ThumbDistance': '.gesture',
     # Mouse
-    'MouseController',
-    'MouseState',
+    'MouseController': '.mouse',
+    'MouseState': '.mouse',
     # Camera
-    'CameraCapture'
-] 
\ No newline at end of file
+    'CameraCapture': '.camera',
+    'FramePool': '.camera',
+    # Application
+    'TrackingApp': '.app_base'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """공개 이름을 처음 접근할 때 하위 모듈 import"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
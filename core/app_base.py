@@ -0,0 +1,324 @@
+"""
+UI-independent application core for SkyTouch.
+"""
+import logging
+import queue
+import threading
+import time
+
+from config.manager import ConfigManager
+from utils.logging.logger import get_logger, set_log_level
+from exceptions.base import HandTrackpadError
+
+logger = get_logger(__name__)
+
+
+class TrackingApp:
+    """
+    UI와 무관한 트래킹 애플리케이션 기본 클래스
+    
+    컴포넌트 구성, 손 인식/트래킹 스레드, 표시용 프레임 전달을 담당합니다.
+    UI 백엔드는 _create_ui()와 _on_tracking_* 훅을 재정의합니다.
+    """
+    
+    def __init__(self):
+        """애플리케이션 초기화"""
+        try:
+            logger.info("SkyTouch 애플리케이션을 시작합니다.")
+            
+            # 설정 관리자 초기화
+            self.config_manager = ConfigManager()
+            self.apply_debug_mode()
+            
+            # 핵심 컴포넌트 초기화
+            self.camera_capture = None
+            self.hand_detector = None
+            self.gesture_detector = None
+            self.mouse_controller = None
+            
+            # 트래킹 상태
+            self.tracking_active = False
+            self.tracking_thread = None
+            self.inference_thread = None
+            self._last_landmarks_ts = 0.0
+            
+            # 추론 → 제스처/마우스 단계 간 큐 (최신 결과만 유지)
+            self._landmark_q = queue.Queue(maxsize=1)
+            
+            # 화면 표시용 최신 프레임 (랜드마크 포함)
+            self._display_frame = None
+            self._display_lock = threading.Lock()
+            
+            # 컴포넌트 초기화
+            self.initialize_components()
+            
+            logger.info("애플리케이션이 성공적으로 초기화되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"애플리케이션 초기화 실패: {e}")
+            raise HandTrackpadError(f"애플리케이션 초기화 실패: {e}")
+    
+    def initialize_components(self) -> None:
+        """컴포넌트 초기화"""
+        # 무거운 모듈(OpenCV, MediaPipe, pyautogui)은 실제로 만들 때 import
+        from core.camera.capture import CameraCapture
+        from core.hand_tracking.detector import HandDetector
+        from core.gesture.detector import GestureDetector
+        from core.mouse.controller import MouseController
+        
+        try:
+            # 카메라 캡처 초기화
+            camera_config = self.config_manager.get_camera_config()
+            self.camera_capture = CameraCapture(camera_config)
+            self.hand_detector = HandDetector(self.config_manager.get_hand_tracking_config())
+            self.gesture_detector = GestureDetector(self.config_manager.get_gesture_config())
+            self.mouse_controller = MouseController(self.camera_capture, self.config_manager)
+            
+            self._create_ui()
+            
+            logger.info("모든 컴포넌트가 초기화되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"컴포넌트 초기화 실패: {e}")
+            raise
+    
+    def apply_debug_mode(self) -> None:
+        """디버그 모드 설정에 따라 로그 레벨 적용 (디버그 모드면 DEBUG 로그까지 기록)"""
+        debug_mode = self.config_manager.config.get('ui', {}).get('debug_mode', False)
+        set_log_level(logging.DEBUG if debug_mode else None)
+    
+    def _create_ui(self) -> None:
+        """UI 생성 (기본: UI 없음)"""
+        pass
+    
+    def _on_tracking_started(self) -> None:
+        """트래킹 시작 후 호출 (UI 갱신용)"""
+        pass
+    
+    def _on_tracking_stopped(self) -> None:
+        """트래킹 정지 후 호출 (UI 갱신용)"""
+        pass
+    
+    def _on_tracking_error(self, message: str) -> None:
+        """트래킹 스레드 오류 시 호출 (UI 갱신용)"""
+        pass
+    
+    @staticmethod
+    def _put_latest(q: queue.Queue, item) -> None:
+        """큐가 가득 차 있으면 가장 오래된 항목을 버리고 추가"""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _inference_worker(self) -> None:
+        """손 인식 단계: 최신 카메라 프레임에서 랜드마크 추출"""
+        try:
+            logger.info("손 인식 스레드를 시작합니다.")
+            
+            # 손이 없을 때는 N 프레임마다 한 번만 감지 (손이 있으면 매 프레임)
+            tracking_config = self.config_manager.get_hand_tracking_config()
+            idle_after = tracking_config.get('idle_detect_after', 1.0)
+            idle_interval = max(1, tracking_config.get('idle_detect_interval', 3))
+            self._last_landmarks_ts = time.perf_counter()
+            skipped_frames = 0
+            
+            while self.tracking_active:
+                # 새 프레임이 캡처될 때까지 대기 (폴링 없음)
+                frame = self.camera_capture.read_latest(timeout=0.5)
+                if frame is None:
+                    # 캡처 스레드가 없으면 바로 반환되므로 재초기화될 때까지 잠시 대기
+                    if not self.camera_capture.is_capturing():
+                        time.sleep(0.1)
+                    continue
+                # 프레임 획득 시각 (제스처 타이밍 기준)
+                frame_time = time.perf_counter()
+                
+                idle = frame_time - self._last_landmarks_ts > idle_after
+                if idle and skipped_frames < idle_interval - 1:
+                    skipped_frames += 1
+                    self._publish_display_frame(frame)
+                    continue
+                skipped_frames = 0
+                
+                try:
+                    # 손 인식 (비동기 모드에서는 완료된 새 결과가 있을 때만 반환)
+                    hand_landmarks_list = self.hand_detector.detect_hands(frame)
+                except Exception as e:
+                    # 손 인식 오류를 처리하는 유일한 경계 (detect_hands는 예외를 그대로 전달)
+                    # 한 프레임 인식 실패로 스레드가 멈추지 않도록 기록 후 프레임 반환, 다음 프레임 진행
+                    logger.error(f"손 인식 중 오류: {e}")
+                    self.camera_capture.release_frame(frame)
+                    continue
+                if hand_landmarks_list:
+                    self._last_landmarks_ts = frame_time
+                    # 제스처/마우스 단계로 전달 (처리되지 않은 이전 결과는 버림)
+                    self._put_latest(self._landmark_q, (frame_time, hand_landmarks_list))
+                
+                # 랜드마크는 표시 단계에서 그림 (추론 단계는 다음 프레임으로 바로 진행)
+                self._publish_display_frame(frame)
+                
+            logger.info("손 인식 스레드가 종료되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"손 인식 스레드 중 오류: {e}")
+    
+    def tracking_loop(self) -> None:
+        """손 트래킹 메인 루프 (제스처 인식 및 마우스 제어 단계)"""
+        try:
+            logger.info("손 트래킹 루프를 시작합니다.")
+            
+            while self.tracking_active:
+                # 손 인식 결과가 들어올 때까지 대기 (폴링 없음)
+                try:
+                    frame_time, hand_landmarks_list = self._landmark_q.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                
+                # 같은 프레임의 손들은 프레임 획득 시각 하나로 처리
+                for hand_landmarks in hand_landmarks_list:
+                    try:
+                        self._handle_hand(hand_landmarks, frame_time)
+                    except Exception as e:
+                        # 한 손 처리 실패로 트래킹이 멈추지 않도록 기록 후 계속
+                        logger.error(f"손 처리 중 오류: {e}")
+
+            logger.info("손 트래킹 루프가 종료되었습니다.")
+                
+        except Exception as e:
+            logger.error(f"손 트래킹 루프 중 오류: {e}")
+            self._on_tracking_error(str(e))
+    
+    def _handle_hand(self, hand_landmarks, current_time: float) -> None:
+        """손 하나에 대해 제스처 인식 및 마우스 제어 수행"""
+        gesture_data = self.gesture_detector.detect_gestures(hand_landmarks, current_time)
+        self.mouse_controller.update_mouse_position(
+            gesture_data.palm_center,
+            gesture_mode=gesture_data.gesture_mode,
+            smoothing=0.5,
+            sensitivity=1.5,
+            invert_x=False,
+            invert_y=False
+        )
+        self.mouse_controller.handle_click(gesture_data.is_clicking)
+        self.mouse_controller.handle_right_click(gesture_data.is_right_clicking)
+        self.mouse_controller.handle_double_click(gesture_data.is_double_clicking)
+        self.mouse_controller.handle_scroll(gesture_data.is_scrolling, gesture_data.scroll_direction)
+        self.mouse_controller.handle_swipe(gesture_data.is_swiping, gesture_data.swipe_direction)
+    
+    def _publish_display_frame(self, frame) -> None:
+        """화면 표시용 프레임 저장 (표시되지 않은 이전 프레임은 반환)"""
+        with self._display_lock:
+            previous_frame = self._display_frame
+            self._display_frame = frame
+        if previous_frame is not None:
+            self.camera_capture.release_frame(previous_frame)
+    
+    def start_tracking(self) -> None:
+        """트래킹 시작"""
+        try:
+            if self.tracking_active:
+                logger.warning("트래킹이 이미 실행 중입니다.")
+                return
+                
+            # 일시정지된 카메라는 재개, 열려있지 않다면 열기
+            if self.camera_capture.is_opened():
+                self.camera_capture.resume()
+            else:
+                # 유휴 시간 초과로 해제된 경우에도 일시정지 상태 해제
+                self.camera_capture.resume()
+                # 최신 설정으로 카메라 초기화
+                camera_config = self.config_manager.get_camera_config()
+                self.camera_capture.config = camera_config  # 설정 업데이트
+                self.camera_capture._init_camera()
+                logger.info(f"카메라가 열렸습니다. (해상도: {camera_config.get('width')}x{camera_config.get('height')}, FPS: {camera_config.get('fps')})")
+            
+            # 상태를 먼저 설정하여 중복 실행 방지
+            self.tracking_active = True
+            
+            # 손 인식 스레드와 트래킹(제스처/마우스) 스레드 시작
+            self.inference_thread = threading.Thread(target=self._inference_worker, daemon=True)
+            self.tracking_thread = threading.Thread(target=self.tracking_loop, daemon=True)
+            self.inference_thread.start()
+            self.tracking_thread.start()
+            
+            self._on_tracking_started()
+            logger.info("트래킹이 시작되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"트래킹 시작 실패: {e}")
+            self.tracking_active = False  # 실패 시 상태 초기화
+            raise
+    
+    def stop_tracking(self) -> None:
+        """트래킹 정지"""
+        try:
+            if not self.tracking_active:
+                logger.warning("트래킹이 이미 정지된 상태입니다.")
+                return
+                
+            # 상태를 먼저 설정하여 중복 실행 방지
+            self.tracking_active = False
+            
+            # 손 인식/트래킹 스레드 종료 대기
+            for thread in (self.inference_thread, self.tracking_thread):
+                if thread and thread.is_alive():
+                    thread.join(timeout=1.0)
+            self.inference_thread = None
+            self.tracking_thread = None
+            
+            # 처리되지 않은 손 인식 결과 제거
+            try:
+                self._landmark_q.get_nowait()
+            except queue.Empty:
+                pass
+            
+            # 카메라는 열어둔 채 일시정지 (재시작 시 장치를 다시 열지 않음)
+            self.camera_capture.pause()
+            
+            self._on_tracking_stopped()
+            logger.info("트래킹이 정지되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"트래킹 정지 실패: {e}")
+            raise
+    
+    def cleanup(self) -> None:
+        """리소스 정리"""
+        try:
+            if self.camera_capture:
+                self.camera_capture.release()
+            if self.hand_detector:
+                self.hand_detector.release()
+            if self.mouse_controller:
+                self.mouse_controller.cleanup()
+            logger.info("애플리케이션 리소스가 정리되었습니다.")
+            
+        except Exception as e:
+            logger.error(f"리소스 정리 중 오류: {e}") 
+
+    def get_camera_frame(self):
+        """
+        트래킹 루프가 처리한 최신 프레임 반환 (새 프레임이 없으면 None)
+        
+        표시가 끝난 프레임은 release_camera_frame()으로 반환해야 합니다.
+        """
+        with self._display_lock:
+            frame = self._display_frame
+            self._display_frame = None
+        
+        # 실제로 표시되는 프레임에만 최근 인식 결과를 그림
+        # (표시 전에 교체된 프레임은 그리지 않고, 비동기 추론 중에도 랜드마크가 깜빡이지 않음)
+        if frame is not None and self.hand_detector:
+            frame = self.hand_detector.draw_latest_landmarks(frame)
+        return frame
+    
+    def release_camera_frame(self, frame) -> None:
+        """표시가 끝난 프레임 버퍼 반환"""
+        if self.camera_capture:
+            self.camera_capture.release_frame(frame) 
\ No newline at end of file
@@ -3,5 +3,6 @@ Camera module for Hand Tracking Trackpad application.
 """
 
 from .capture import CameraCapture
+from .frame_pool import FramePool
 
-__all__ = ['CameraCapture'] 
\ No newline at end of file
+__all__ = ['CameraCapture', 'FramePool'] 
\ No newline at end of file
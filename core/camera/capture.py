@@ -1,16 +1,72 @@
 """
 Camera capture for Hand Tracking Trackpad application.
 """
+import threading
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
+from .frame_pool import FramePool
 from utils.logging.logger import get_logger
 from exceptions.base import CameraError
 
 logger = get_logger(__name__)
 
 
+class _CaptureThread(threading.Thread):
+    """카메라 프레임 캡처 스레드 (최신 프레임만 유지)"""
+    
+    def __init__(self, capture: "CameraCapture"):
+        super().__init__(name="CameraCaptureThread", daemon=True)
+        self.capture = capture
+        self._stop_event = threading.Event()
+    
+    def run(self) -> None:
+        """카메라에서 프레임을 읽어 최신 프레임으로 저장"""
+        cap = self.capture.cap
+        pool = self.capture._frame_pool
+        frame_wanted = self.capture._frame_wanted
+        resume_event = self.capture._resume_event
+        while not self._stop_event.is_set():
+            # 일시정지 중에는 장치를 연 채로 프레임을 읽지 않음
+            if not resume_event.is_set():
+                if resume_event.wait(0.2) and not self._stop_event.is_set():
+                    # 일시정지 동안 드라이버에 남은 오래된 프레임 버림
+                    cap.grab()
+                continue
+            
+            # 드라이버 버퍼는 항상 비워서 오래된 프레임이 쌓이지 않도록 함
+            if not cap.grab():
+                logger.warning("카메라에서 프레임을 읽을 수 없습니다.")
+                # 장치 오류 시 과도한 재시도 방지
+                self._stop_event.wait(0.1)
+                continue
+            
+            # 소비자가 프레임을 요청하기 전에는 디코딩하지 않고 버림
+            # (요청 후에는 grab마다 디코딩해 슬롯에 항상 가장 최근에 grab한 프레임 유지)
+            if not frame_wanted.is_set():
+                continue
+            
+            # 미리 할당된 버퍼에 직접 디코딩 (프레임마다 새 배열 할당 방지)
+            buffer = pool.acquire()
+            ret, frame = cap.retrieve(buffer)
+            if not ret:
+                pool.release(buffer)
+                logger.warning("카메라 프레임 디코딩에 실패했습니다.")
+                continue
+            if frame is not buffer:
+                # 드라이버가 설정과 다른 해상도를 반환한 경우 풀 크기 조정
+                pool.release(buffer)
+                pool.resize(frame.shape)
+            self.capture._publish_frame(frame)
+    
+    def stop(self) -> None:
+        """캡처 스레드 정지"""
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
+
+
 class CameraCapture:
     """카메라 캡처 클래스"""
     
@@ -24,6 +80,26 @@ class CameraCapture:
         try:
             self.config = config
             self.cap = None
+            
+            # 캡처 스레드 및 최신 프레임
+            self._capture_thread = None
+            self._frame_cond = threading.Condition()
+            self._latest_frame = None
+            self._frame_seq = 0
+            self._read_seq = 0
+            self._frame_pool = None
+            self._frame_wanted = threading.Event()
+            
+            # 장치 열 때 한 번만 조회한 실제 해상도/FPS (드라이버 왕복 비용 회피)
+            self._actual_resolution = None
+            self._actual_fps = None
+            # 실제 해상도가 확인될 때 호출할 콜백 (width, height)
+            self._resolution_listeners = []
+            
+            # 일시정지 상태 (set: 캡처 중) 및 장기 유휴 시 장치 해제 타이머
+            self._resume_event = threading.Event()
+            self._resume_event.set()
+            self._idle_release_timer = None
             # 카메라 자동 초기화 제거 - 사용자가 시작할 때 열림
             logger.info("카메라 캡처가 초기화되었습니다. (카메라는 사용자가 시작할 때 열립니다)")
             
@@ -34,17 +110,94 @@ class CameraCapture:
     def _init_camera(self) -> None:
         """카메라 초기화"""
         self.cap = cv2.VideoCapture(self.config.get('device_id', 0))
+        if not self.cap.isOpened():
+            raise CameraError("카메라를 열 수 없습니다.")
+        
+        # 드라이버 프레임 큐를 1로 제한 (추론 지연 시 오래된 프레임 누적 방지)
+        # 일부 백엔드는 스트림 포맷 협상 시 버퍼를 할당하므로 포맷/해상도 설정 전에 지정
+        if not self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            logger.warning("카메라 백엔드가 버퍼 크기 설정을 지원하지 않습니다.")
+        
+        # MJPEG 요청 (USB 대역폭 절감, 드라이버의 YUY2→BGR 변환 회피)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.get('width', 480))
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.get('height', 360))
         self.cap.set(cv2.CAP_PROP_FPS, self.config.get('fps', 30))
         
-        if not self.cap.isOpened():
-            raise CameraError("카메라를 열 수 없습니다.")
+        # 드라이버가 MJPEG를 거부했는지 확인하기 위해 협상된 포맷 기록
+        fourcc = self._decode_fourcc(self.cap.get(cv2.CAP_PROP_FOURCC))
+        if fourcc == 'MJPG':
+            logger.info("카메라 픽셀 포맷: MJPG")
+        else:
+            logger.warning(f"카메라가 MJPG를 지원하지 않아 기본 포맷을 사용합니다: {fourcc or '알 수 없음'}")
+        
+        # 협상된 해상도/FPS는 장치를 다시 열기 전까지 바뀌지 않으므로 캐시
+        width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._actual_resolution = (width, height)
+        self._actual_fps = self.cap.get(cv2.CAP_PROP_FPS)
+        logger.info(f"실제 웹캠 해상도: {width}x{height}, FPS: {self._actual_fps}")
+        for listener in self._resolution_listeners:
+            listener(width, height)
+        
+        # 실제 해상도 기준으로 프레임 버퍼 미리 할당 (더블 버퍼링)
+        self._frame_pool = FramePool((height, width, 3), size=2)
+        
+        self._start_capture_thread()
+    
+    @staticmethod
+    def _decode_fourcc(value: float) -> str:
+        """CAP_PROP_FOURCC 값을 4문자 코드로 변환"""
+        code = int(value)
+        return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ')
+    
+    def _start_capture_thread(self) -> None:
+        """캡처 스레드 시작"""
+        with self._frame_cond:
+            self._drop_latest_frame()
+            self._read_seq = self._frame_seq
+        self._frame_wanted.set()
+        self._capture_thread = _CaptureThread(self)
+        self._capture_thread.start()
+    
+    def _stop_capture_thread(self) -> None:
+        """캡처 스레드 정지"""
+        if self._capture_thread:
+            self._capture_thread.stop()
+            self._capture_thread = None
+        # 대기 중인 소비자 깨우기
+        with self._frame_cond:
+            self._frame_cond.notify_all()
+    
+    def _publish_frame(self, frame: np.ndarray) -> None:
+        """캡처 스레드에서 읽은 최신 프레임 저장"""
+        with self._frame_cond:
+            self._drop_latest_frame()
+            self._latest_frame = frame
+            self._frame_seq += 1
+            self._frame_cond.notify_all()
+    
+    def _drop_latest_frame(self) -> None:
+        """이전 최신 프레임의 참조 해제 (_frame_cond 보유 상태에서 호출)"""
+        if self._latest_frame is not None and self._frame_pool:
+            self._frame_pool.release(self._latest_frame)
+        self._latest_frame = None
+    
+    def release_frame(self, frame: np.ndarray) -> None:
+        """
+        read()/read_latest()로 받은 프레임 반환
+        
+        Args:
+            frame: 사용이 끝난 프레임 (버퍼는 캡처 스레드에서 재사용됨)
+        """
+        if self._frame_pool and frame is not None:
+            self._frame_pool.release(frame)
     
     def reinitialize(self) -> None:
         """카메라 재초기화"""
         try:
             # 기존 카메라 해제
+            self._stop_capture_thread()
             if self.cap and self.cap.isOpened():
                 self.cap.release()
             
@@ -63,21 +216,88 @@ class CameraCapture:
         Returns:
             카메라 프레임 또는 None
         """
-        try:
-            ret, frame = self.cap.read()
-            if not ret:
-                logger.warning("카메라에서 프레임을 읽을 수 없습니다.")
-                return None
-            return frame
-            
-        except Exception as e:
-            logger.error(f"프레임 가져오기 중 오류: {e}")
-            return None
+        ret, frame = self.read()
+        return frame if ret else None
     
     def read(self):
-        if self.cap is not None:
-            return self.cap.read()
-        return False, None
+        """
+        캡처 스레드가 저장한 최신 프레임 반환 (대기 없음)
+        
+        반환된 프레임은 사용 후 release_frame()으로 반환해야 버퍼가 재사용됩니다.
+        """
+        with self._frame_cond:
+            frame = self._latest_frame
+            if frame is not None:
+                self._frame_pool.retain(frame)
+        # 다음 프레임 디코딩 요청
+        self._frame_wanted.set()
+        return frame is not None, frame
+    
+    def read_latest(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        새 프레임이 캡처될 때까지 대기 후 최신 프레임 반환
+        
+        반환된 프레임은 사용 후 release_frame()으로 반환해야 버퍼가 재사용됩니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초), None이면 무한 대기
+            
+        Returns:
+            최신 카메라 프레임 또는 None (시간 초과/카메라 정지)
+        """
+        # 캡처 스레드에 다음 프레임 디코딩 요청
+        self._frame_wanted.set()
+        with self._frame_cond:
+            has_frame = self._frame_cond.wait_for(
+                lambda: self._frame_seq != self._read_seq or self._capture_thread is None,
+                timeout
+            )
+            if not has_frame or self._frame_seq == self._read_seq:
+                return None
+            self._read_seq = self._frame_seq
+            self._frame_pool.retain(self._latest_frame)
+            return self._latest_frame
+    
+    def pause(self) -> None:
+        """
+        캡처 일시정지 (장치는 열린 상태 유지)
+        
+        장치를 다시 여는 비용(수백 ms~수 초) 없이 즉시 재개할 수 있습니다.
+        idle_release_timeout 동안 재개되지 않으면 장치를 해제합니다.
+        """
+        self._resume_event.clear()
+        # 재개 후 다시 요청될 때까지 디코딩 중지
+        self._frame_wanted.clear()
+        self._cancel_idle_release()
+        
+        idle_timeout = self.config.get('idle_release_timeout', 30.0)
+        if idle_timeout and idle_timeout > 0 and self.is_opened():
+            self._idle_release_timer = threading.Timer(idle_timeout, self._release_if_paused)
+            self._idle_release_timer.daemon = True
+            self._idle_release_timer.start()
+        logger.info("카메라 캡처가 일시정지되었습니다.")
+    
+    def resume(self) -> None:
+        """캡처 재개"""
+        self._cancel_idle_release()
+        self._resume_event.set()
+        logger.info("카메라 캡처가 재개되었습니다.")
+    
+    def is_paused(self) -> bool:
+        """캡처 일시정지 상태 확인"""
+        return not self._resume_event.is_set()
+    
+    def _cancel_idle_release(self) -> None:
+        """유휴 장치 해제 타이머 취소"""
+        if self._idle_release_timer:
+            self._idle_release_timer.cancel()
+            self._idle_release_timer = None
+    
+    def _release_if_paused(self) -> None:
+        """일시정지가 유지되고 있으면 장치 해제 (전력 절약)"""
+        if self.is_paused():
+            logger.info("카메라가 오래 일시정지되어 장치를 해제합니다.")
+            self.release()
     
     def get_actual_resolution(self) -> Tuple[int, int]:
         """
@@ -87,11 +307,8 @@ class CameraCapture:
             실제 웹캠 해상도 (width, height)
         """
         try:
-            if self.cap and self.cap.isOpened():
-                actual_width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                actual_height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                logger.debug(f"실제 웹캠 해상도: {actual_width}x{actual_height}")
-                return (actual_width, actual_height)
+            if self._actual_resolution is not None:
+                return self._actual_resolution
             else:
                 logger.warning("카메라가 열려있지 않아 설정된 해상도를 반환합니다.")
                 return (self.config.get('width', 480), self.config.get('height', 360))
@@ -108,15 +325,37 @@ class CameraCapture:
         """
         return self.cap is not None and self.cap.isOpened()
     
+    def is_capturing(self) -> bool:
+        """캡처 스레드가 실행 중인지 확인"""
+        return self._capture_thread is not None
+    
+    def add_resolution_listener(self, callback: Callable[[int, int], None]) -> None:
+        """장치를 열어 실제 해상도가 확인될 때마다 호출할 콜백 등록"""
+        self._resolution_listeners.append(callback)
+    
+    def get_actual_fps(self) -> float:
+        """실제 웹캠 FPS (카메라가 열려있지 않으면 설정값)"""
+        if self._actual_fps:
+            return self._actual_fps
+        return float(self.config.get('fps', 30))
+    
+    def _invalidate_properties(self) -> None:
+        """캐시된 장치 속성 무효화"""
+        self._actual_resolution = None
+        self._actual_fps = None
+    
     def update_config(self, config: dict) -> None:
         """설정 업데이트"""
         try:
+            device_keys = ('device_id', 'width', 'height', 'fps')
+            changed = any(config.get(key) != self.config.get(key) for key in device_keys)
             self.config = config
             
-            if self.cap and self.cap.isOpened():
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.get('width', 480))
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.get('height', 360))
-                self.cap.set(cv2.CAP_PROP_FPS, config.get('fps', 30))
+            # 장치 설정이 바뀐 경우에만 장치를 다시 열기 (캡처 스레드 동작 중 속성 변경 방지)
+            if changed:
+                self._invalidate_properties()
+                if self.cap and self.cap.isOpened():
+                    self.reinitialize()
             
             logger.info("카메라 캡처 설정이 업데이트되었습니다.")
             
@@ -126,9 +365,13 @@ class CameraCapture:
     def release(self) -> None:
         """리소스 해제"""
         try:
+            if threading.current_thread() is not self._idle_release_timer:
+                self._cancel_idle_release()
+            self._stop_capture_thread()
             if self.cap and self.cap.isOpened():
                 self.cap.release()
                 self.cap = None
+                self._invalidate_properties()
                 logger.info("카메라 캡처 리소스가 해제되었습니다.")
             
         except Exception as e:
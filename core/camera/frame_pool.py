@@ -0,0 +1,73 @@
+"""
+Frame buffer pool for Hand Tracking Trackpad application.
+"""
+import threading
+import numpy as np
+from typing import Tuple
+
+from utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FramePool:
+    """참조 카운트 기반 프레임 버퍼 풀"""
+
+    def __init__(self, shape: Tuple[int, ...], size: int = 2, dtype=np.uint8):
+        """
+        프레임 버퍼 풀 초기화
+
+        Args:
+            shape: 프레임 버퍼 형태 (height, width, channels)
+            size: 미리 할당할 버퍼 개수
+            dtype: 버퍼 데이터 타입
+        """
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.size = size
+        self._lock = threading.Lock()
+        self._free = [np.empty(self.shape, dtype=self.dtype) for _ in range(size)]
+        self._refs = {}  # id(buffer) -> [buffer, 참조 수]
+
+    def acquire(self) -> np.ndarray:
+        """
+        사용 가능한 버퍼 가져오기 (참조 수 1)
+
+        Returns:
+            프레임 버퍼 (모든 버퍼가 사용 중이면 새로 할당)
+        """
+        with self._lock:
+            if self._free:
+                buffer = self._free.pop()
+            else:
+                buffer = np.empty(self.shape, dtype=self.dtype)
+                logger.debug("프레임 버퍼 추가 할당 (사용 중: %d개)", len(self._refs) + 1)
+            self._refs[id(buffer)] = [buffer, 1]
+            return buffer
+
+    def retain(self, buffer: np.ndarray) -> None:
+        """버퍼 참조 수 증가"""
+        with self._lock:
+            entry = self._refs.get(id(buffer))
+            if entry is not None:
+                entry[1] += 1
+
+    def release(self, buffer: np.ndarray) -> None:
+        """버퍼 참조 수 감소 (0이 되면 풀로 반환)"""
+        with self._lock:
+            entry = self._refs.get(id(buffer))
+            if entry is None:
+                # 풀에서 할당하지 않은 버퍼는 무시
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._refs[id(buffer)]
+                if buffer.shape == self.shape:
+                    self._free.append(buffer)
+
+    def resize(self, shape: Tuple[int, ...]) -> None:
+        """버퍼 형태 변경 (사용 중인 버퍼는 반환 시 폐기)"""
+        with self._lock:
+            self.shape = tuple(shape)
+            self._free = [np.empty(self.shape, dtype=self.dtype) for _ in range(self.size)]
+        logger.info(f"프레임 버퍼 풀 크기 변경: {self.shape}")
@@ -1,13 +1,38 @@
 """
 Gesture classifier for Hand Tracking Trackpad application.
 """
+import logging
+from collections import deque
 from typing import Dict
 
 from .types import GestureType, FingerState, ThumbDistance
+from .kernels import (
+    click_step, new_click_state,
+    ACTION_CLICK, ACTION_RIGHT_CLICK, ACTION_DOUBLE_CLICK,
+    STATE_INDEX_TOUCHING, STATE_MIDDLE_TOUCHING, STATE_MODE_CHANGE_TIME
+)
 from utils.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 손가락 비트마스크 (검지<<3 | 중지<<2 | 약지<<1 | 새끼) → 제스처 모드
+# 새끼손가락이 펴진 경우와 정의되지 않은 조합은 모두 클릭 모드
+_MODE_OVERRIDES = {
+    0b0000: GestureType.SWIPE,   # 주먹 (모든 손가락 접음)
+    0b1100: GestureType.SCROLL,  # 검지와 중지만 폄
+    0b1000: GestureType.MOVE,    # 검지만 폄
+}
+# 마스크로 바로 인덱싱하는 16칸 튜플 (해시 조회 없음)
+_MODE_TABLE = tuple(_MODE_OVERRIDES.get(mask, GestureType.CLICK) for mask in range(16))
+
+
+def finger_mask(finger_state: FingerState) -> int:
+    """손가락 상태를 4비트 마스크로 변환 (검지<<3 | 중지<<2 | 약지<<1 | 새끼)"""
+    return ((finger_state.index_extended << 3) |
+            (finger_state.middle_extended << 2) |
+            (finger_state.ring_extended << 1) |
+            finger_state.pinky_extended)
+
 
 class GestureClassifier:
     """제스처 분류기 클래스"""
@@ -22,23 +47,21 @@ class GestureClassifier:
         self.config = config
         self.finger_threshold = config.get('finger_threshold', 0.02)
         self.click_threshold = config.get('click_threshold', 0.12)
+        self._click_threshold_sq = self.click_threshold ** 2
         
-        # 제스처 히스토리
-        self.gesture_history = []
+        # 제스처 모드 히스토리 (최근 모드만 보관, 프레임마다 딕셔너리를 만들지 않음)
         self.max_history_size = 3
+        self._hist_modes = deque(maxlen=self.max_history_size)
         
         # 모드 안정화 변수들
         self.current_gesture_mode = GestureType.CLICK.value
         self.mode_start_time = 0.0
         self.is_mode_stable = False
-        self.mode_change_time = 0.0  # 모드 변경 시간 추적
         self.mode_change_delay = 0.1  # 모드 변경 후 클릭 무시 시간 (초)
+        self.double_click_interval = 0.5  # 더블클릭 판정 간격 (초)
         
-        # 클릭 상태 추적 변수들
-        self.thumb_index_touching = False
-        self.thumb_middle_touching = False
-        self.last_click_time = 0.0
-        self.click_count = 0
+        # 클릭 상태 (터치 여부, 마지막 클릭 시간, 클릭 횟수, 모드 변경 시간)
+        self._click_state = new_click_state()
         
         logger.info("제스처 분류기가 초기화되었습니다.")
     
@@ -53,61 +76,46 @@ class GestureClassifier:
         Returns:
             제스처 타입
         """
-        # 클릭 모드: 새끼손가락이 펴진 상태 (다른 손가락은 상관없음)
-        if (finger_state.pinky_extended):
-            return GestureType.CLICK
-        
-        # 스와이프 모드: 주먹 (모든 손가락을 접은 상태)
-        elif not any([finger_state.index_extended, finger_state.middle_extended, 
-                     finger_state.ring_extended, finger_state.pinky_extended]):
-            return GestureType.SWIPE
+        return self.classify_mask(finger_mask(finger_state), thumb_distance)
+    
+    def classify_mask(self, mask: int, thumb_distance: ThumbDistance) -> GestureType:
+        """
+        손가락 비트마스크와 엄지 거리를 기반으로 제스처 분류
         
-        # 스크롤 모드: 검지와 중지를 펴진 상태 (엄격한 조건)
-        elif (finger_state.index_extended and finger_state.middle_extended and 
-              not finger_state.ring_extended and not finger_state.pinky_extended):
-            # 중지가 손바닥에 닿지 않았는지 추가 확인
-            if thumb_distance.thumb_middle_distance > self.click_threshold:
-                logger.debug("스크롤 모드 감지: 검지+중지 펴짐, 중지 터치 없음")
-                return GestureType.SCROLL
-            else:
-                logger.debug("중지가 손바닥에 닿아서 스크롤 모드 무효화")
-                # 중지가 닿으면 클릭 모드로 처리
-                return GestureType.CLICK
+        Args:
+            mask: 손가락 비트마스크 (검지<<3 | 중지<<2 | 약지<<1 | 새끼)
+            thumb_distance: 엄지 거리
+            
+        Returns:
+            제스처 타입
+        """
+        gesture_mode = _MODE_TABLE[mask]
         
-        # 이동 모드: 검지만 편 상태
-        elif (finger_state.index_extended and not finger_state.middle_extended and 
-              not finger_state.ring_extended and not finger_state.pinky_extended):
-            return GestureType.MOVE
+        # 스크롤 모드에서 중지가 엄지에 닿으면 클릭 모드로 처리
+        if (gesture_mode is GestureType.SCROLL and
+                thumb_distance.thumb_middle_distance_sq <= self._click_threshold_sq):
+            logger.debug("중지가 손바닥에 닿아서 스크롤 모드 무효화")
+            return GestureType.CLICK
         
-        return GestureType.CLICK  # 기본값
+        return gesture_mode
     
     def get_stable_gesture_mode(self, current_mode: GestureType) -> GestureType:
         """히스토리를 바탕으로 안정적인 제스처 모드 결정"""
-        # 스크롤 모드는 히스토리 사용 안함 (즉시 반응)
-        if current_mode == GestureType.SCROLL:
-            return current_mode
-        
-        if len(self.gesture_history) < 3:
-            return current_mode
-        
-        # 최근 3프레임의 모드 확인
-        recent_modes = [gesture['mode'] for gesture in self.gesture_history[-3:]]
-        
-        # 3프레임 동안 들어온 모드가 히스토리와 다 다르면 모드 변경
-        if current_mode.value not in recent_modes:
-            logger.debug(f"제스처 모드 변경: 3프레임 연속 {current_mode.value} 감지")
-            return current_mode
-        else:
-            # 히스토리와 일치하면 현재 모드 유지
-            return current_mode
+        # 히스토리와 일치하든 다르든 현재 모드를 사용하므로 히스토리 검사는 디버그 로그용
+        # (스크롤 모드는 히스토리 사용 안함, 즉시 반응)
+        if (current_mode is not GestureType.SCROLL and logger.isEnabledFor(logging.DEBUG) and
+                len(self._hist_modes) == self.max_history_size and current_mode not in self._hist_modes):
+            logger.debug("제스처 모드 변경: 3프레임 연속 %s 감지", current_mode.value)
+        return current_mode
     
-    def add_to_gesture_history(self, gesture_info: dict) -> None:
-        """제스처 히스토리에 현재 프레임 정보 추가"""
-        self.gesture_history.append(gesture_info)
-        
-        # 히스토리 크기 제한
-        if len(self.gesture_history) > self.max_history_size:
-            self.gesture_history.pop(0)
+    def add_to_gesture_history(self, mode: GestureType) -> None:
+        """제스처 히스토리에 현재 프레임 모드 추가"""
+        # deque(maxlen)이 오래된 항목을 자동으로 제거
+        self._hist_modes.append(mode)
+    
+    def clear_gesture_history(self) -> None:
+        """제스처 히스토리 초기화"""
+        self._hist_modes.clear()
     
     def handle_mode_change(self, gesture_mode: GestureType, current_time: float) -> None:
         """모드 변경 처리"""
@@ -119,76 +127,44 @@ class GestureClassifier:
             # 모드 변경 시 클릭 상태 리셋 (우클릭 오발 방지)
             self.reset_click_states()
             
-            self.gesture_history.clear()
+            self.clear_gesture_history()
             self.current_gesture_mode = gesture_mode.value
             self.is_mode_stable = True
-            self.mode_change_time = current_time  # 모드 변경 시간 기록
-            logger.debug(f"모드 변경: {gesture_mode.value} (히스토리 초기화, 클릭 상태 리셋, 즉시 안정화)")
+            self._click_state[STATE_MODE_CHANGE_TIME] = current_time  # 모드 변경 시간 기록
+            logger.debug("모드 변경: %s (히스토리 초기화, 클릭 상태 리셋, 즉시 안정화)", gesture_mode.value)
     
     def detect_click_actions(self, thumb_distance: ThumbDistance, current_time: float) -> Dict[str, bool]:
         """클릭 감지 (클릭 모드에서만 실행)"""
+        action_mask = click_step(
+            self._click_state,
+            thumb_distance.thumb_index_distance_sq,
+            thumb_distance.thumb_middle_distance_sq,
+            self._click_threshold_sq,
+            current_time,
+            self.mode_change_delay,
+            self.double_click_interval
+        )
+        
         actions = {
-            'is_clicking': False,
-            'is_right_clicking': False,
-            'is_double_clicking': False
+            'is_clicking': bool(action_mask & ACTION_CLICK),
+            'is_right_clicking': bool(action_mask & ACTION_RIGHT_CLICK),
+            'is_double_clicking': bool(action_mask & ACTION_DOUBLE_CLICK)
         }
-        
-        # 모드 변경 후 일정 시간 동안 클릭 무시 (우클릭 오발 방지)
-        if current_time - self.mode_change_time < self.mode_change_delay:
-            return actions
-        
-        # 엄지-검지 클릭 감지 (클릭 모드에서만)
-        if thumb_distance.thumb_index_distance < self.click_threshold:
-            # 손가락이 닿음
-            if not self.thumb_index_touching:
-                logger.debug(f"엄지-검지 터치 시작 (거리: {thumb_distance.thumb_index_distance:.3f})")
-            self.thumb_index_touching = True
-        else:
-            # 손가락이 떨어짐
-            if self.thumb_index_touching:
-                # 터치가 끝났으므로 클릭 실행
-                actions['is_clicking'] = True
-                logger.debug(f"좌클릭 실행: 엄지-검지 떼어짐 (거리: {thumb_distance.thumb_index_distance:.3f})")
-                
-                # 더블클릭 감지
-                if current_time - self.last_click_time < 0.5:
-                    self.click_count += 1
-                    if self.click_count >= 2:
-                        actions['is_double_clicking'] = True
-                        self.click_count = 0
-                        logger.debug("더블클릭 감지!")
-                else:
-                    self.click_count = 1
-                
-                self.last_click_time = current_time
-            
-            self.thumb_index_touching = False
-        
-        # 엄지-중지 우클릭 감지 (클릭 모드에서만)
-        if thumb_distance.thumb_middle_distance < self.click_threshold:
-            # 손가락이 닿음
-            if not self.thumb_middle_touching:
-                logger.debug(f"엄지-중지 터치 시작 (거리: {thumb_distance.thumb_middle_distance:.3f})")
-            self.thumb_middle_touching = True
-        else:
-            # 손가락이 떨어짐
-            if self.thumb_middle_touching:
-                # 터치가 끝났으므로 우클릭 실행
-                actions['is_right_clicking'] = True
-                logger.debug(f"우클릭 실행: 엄지-중지 떼어짐 (거리: {thumb_distance.thumb_middle_distance:.3f})")
-            
-            self.thumb_middle_touching = False
+        if action_mask and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("클릭 액션: %s (엄지-검지: %.3f, 엄지-중지: %.3f)", actions,
+                         thumb_distance.thumb_index_distance, thumb_distance.thumb_middle_distance)
         
         return actions
     
     def reset_click_states(self) -> None:
         """클릭 상태 리셋"""
-        self.thumb_index_touching = False
-        self.thumb_middle_touching = False
+        self._click_state[STATE_INDEX_TOUCHING] = 0.0
+        self._click_state[STATE_MIDDLE_TOUCHING] = 0.0
     
     def update_config(self, config: dict) -> None:
         """설정 업데이트"""
         self.config = config
         self.finger_threshold = config.get('finger_threshold', 0.02)
         self.click_threshold = config.get('click_threshold', 0.12)
+        self._click_threshold_sq = self.click_threshold ** 2
         logger.info("제스처 분류기 설정이 업데이트되었습니다.") 
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+Numeric gesture kernels for Hand Tracking Trackpad application.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba가 없으면 순수 파이썬 함수로 실행
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# 손가락 팁/MCP 랜드마크 인덱스 (검지, 중지, 약지, 새끼 순)
+FINGER_TIPS = (8, 12, 16, 20)
+FINGER_MCPS = (5, 9, 13, 17)
+
+# 이동 방향 코드 (DIR_NONE이면 이동 없음)
+DIR_NONE = 0
+DIR_RIGHT = 1
+DIR_LEFT = 2
+DIR_UP = 3
+DIR_DOWN = 4
+
+# 클릭 액션 비트마스크
+ACTION_CLICK = 1
+ACTION_RIGHT_CLICK = 2
+ACTION_DOUBLE_CLICK = 4
+
+# 클릭 상태 배열 인덱스
+STATE_INDEX_TOUCHING = 0
+STATE_MIDDLE_TOUCHING = 1
+STATE_LAST_CLICK_TIME = 2
+STATE_CLICK_COUNT = 3
+STATE_MODE_CHANGE_TIME = 4
+STATE_SIZE = 5
+
+
+def new_click_state() -> np.ndarray:
+    """클릭 상태 배열 생성"""
+    return np.zeros(STATE_SIZE, dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def extract_features(landmarks, finger_threshold):
+    """
+    랜드마크 배열에서 프레임별 제스처 특징 추출
+
+    Args:
+        landmarks: (21, 3) float32 정규화 좌표
+        finger_threshold: 손가락 펴짐 판정 여유값
+
+    Returns:
+        (손가락 비트마스크 (검지<<3 | 중지<<2 | 약지<<1 | 새끼),
+         엄지-검지 거리 제곱, 엄지-중지 거리 제곱, 손바닥 x, y, z)
+    """
+    finger_bits = 0
+    for i in range(4):
+        # 손가락이 펴져있으면 팁이 MCP보다 위에 있음 (y값이 작음)
+        if landmarks[FINGER_TIPS[i], 1] < landmarks[FINGER_MCPS[i], 1] - finger_threshold:
+            finger_bits |= 1 << (3 - i)
+
+    thumb_x = landmarks[4, 0]
+    thumb_y = landmarks[4, 1]
+    thumb_z = landmarks[4, 2]
+    dx = landmarks[8, 0] - thumb_x
+    dy = landmarks[8, 1] - thumb_y
+    dz = landmarks[8, 2] - thumb_z
+    thumb_index_sq = dx * dx + dy * dy + dz * dz
+    dx = landmarks[12, 0] - thumb_x
+    dy = landmarks[12, 1] - thumb_y
+    dz = landmarks[12, 2] - thumb_z
+    thumb_middle_sq = dx * dx + dy * dy + dz * dz
+
+    # 손바닥 중심: 중지 MCP 관절
+    return (finger_bits, thumb_index_sq, thumb_middle_sq,
+            landmarks[9, 0], landmarks[9, 1], landmarks[9, 2])
+
+
+@njit(cache=True)
+def movement_direction(delta_x, delta_y, min_distance, min_distance_sq, invert_x, invert_y):
+    """
+    손바닥 변화량으로 이동 방향 결정
+
+    Args:
+        delta_x, delta_y: 이전 프레임 대비 손바닥 변화량
+        min_distance: 축별 최소 이동 거리
+        min_distance_sq: 방향 계산을 생략할 이동 거리의 제곱
+        invert_x, invert_y: 축 반전 여부
+
+    Returns:
+        이동 방향 코드 (DIR_*)
+    """
+    # 이동 거리가 임계값보다 작으면 방향 계산 생략 (제곱 거리 비교)
+    if delta_x * delta_x + delta_y * delta_y < min_distance_sq:
+        return DIR_NONE
+    if invert_x:
+        delta_x = -delta_x
+    if invert_y:
+        delta_y = -delta_y
+
+    abs_x = abs(delta_x)
+    abs_y = abs(delta_y)
+    if abs_x > abs_y and abs_x > min_distance:
+        return DIR_RIGHT if delta_x > 0 else DIR_LEFT
+    if abs_y > min_distance:
+        return DIR_UP if delta_y < 0 else DIR_DOWN
+    return DIR_NONE
+
+
+@njit(cache=True)
+def click_step(state, thumb_index_distance_sq, thumb_middle_distance_sq,
+               click_threshold_sq, current_time, mode_change_delay, double_click_interval):
+    """
+    클릭 상태 머신 한 프레임 진행
+
+    Args:
+        state: 클릭 상태 배열 (제자리 갱신)
+        thumb_index_distance_sq: 엄지-검지 거리의 제곱
+        thumb_middle_distance_sq: 엄지-중지 거리의 제곱
+        click_threshold_sq: 터치 판정 거리의 제곱
+        current_time: 현재 시간 (초)
+        mode_change_delay: 모드 변경 후 클릭 무시 시간 (초)
+        double_click_interval: 더블클릭 판정 간격 (초)
+
+    Returns:
+        클릭 액션 비트마스크
+    """
+    actions = 0
+
+    # 모드 변경 후 일정 시간 동안 클릭 무시 (우클릭 오발 방지)
+    if current_time - state[STATE_MODE_CHANGE_TIME] < mode_change_delay:
+        return actions
+
+    # 엄지-검지: 닿았다가 떨어질 때 좌클릭
+    if thumb_index_distance_sq < click_threshold_sq:
+        state[STATE_INDEX_TOUCHING] = 1.0
+    else:
+        if state[STATE_INDEX_TOUCHING] != 0.0:
+            actions |= ACTION_CLICK
+            if current_time - state[STATE_LAST_CLICK_TIME] < double_click_interval:
+                state[STATE_CLICK_COUNT] += 1.0
+                if state[STATE_CLICK_COUNT] >= 2.0:
+                    actions |= ACTION_DOUBLE_CLICK
+                    state[STATE_CLICK_COUNT] = 0.0
+            else:
+                state[STATE_CLICK_COUNT] = 1.0
+            state[STATE_LAST_CLICK_TIME] = current_time
+        state[STATE_INDEX_TOUCHING] = 0.0
+
+    # 엄지-중지: 닿았다가 떨어질 때 우클릭
+    if thumb_middle_distance_sq < click_threshold_sq:
+        state[STATE_MIDDLE_TOUCHING] = 1.0
+    else:
+        if state[STATE_MIDDLE_TOUCHING] != 0.0:
+            actions |= ACTION_RIGHT_CLICK
+        state[STATE_MIDDLE_TOUCHING] = 0.0
+
+    return actions
@@ -3,7 +3,8 @@ Gesture types and data classes for Hand Tracking Trackpad application.
 """
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Dict, Any
+from math import sqrt
+from typing import Tuple, Dict, Any
 
 
 class GestureType(Enum):
@@ -14,10 +15,10 @@ class GestureType(Enum):
     SWIPE = "swipe"
 
 
-@dataclass
+@dataclass(slots=True)
 class GestureData:
     """제스처 데이터 클래스"""
-    palm_center: List[float]
+    palm_center: Tuple[float, float, float]  # (x, y, z), x는 좌우반전
     gesture_mode: GestureType  # GestureType enum 사용
     is_clicking: bool  # 클릭 모드에서 클릭
     is_right_clicking: bool  # 클릭 모드에서 우클릭
@@ -29,7 +30,7 @@ class GestureData:
     metadata: Dict[str, Any] = None  # 추가 메타데이터
 
 
-@dataclass
+@dataclass(slots=True)
 class FingerState:
     """손가락 상태 데이터 클래스"""
     index_extended: bool
@@ -38,8 +39,18 @@ class FingerState:
     pinky_extended: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ThumbDistance:
-    """엄지 거리 데이터 클래스"""
-    thumb_index_distance: float
-    thumb_middle_distance: float 
\ No newline at end of file
+    """엄지 거리 데이터 클래스 (비교는 제곱 거리로 수행하여 sqrt 생략)"""
+    thumb_index_distance_sq: float
+    thumb_middle_distance_sq: float
+    
+    @property
+    def thumb_index_distance(self) -> float:
+        """엄지-검지 거리"""
+        return sqrt(self.thumb_index_distance_sq)
+    
+    @property
+    def thumb_middle_distance(self) -> float:
+        """엄지-중지 거리"""
+        return sqrt(self.thumb_middle_distance_sq) 
\ No newline at end of file
@@ -27,65 +27,86 @@ class HandDetector:
             self.mediapipe_wrapper = MediaPipeWrapper(config)
             self.landmark_processor = LandmarkProcessor()
             self.last_results = None  # MediaPipe 결과 저장용
+            self._last_hands = None  # 마지막으로 변환된 손 랜드마크 (그리기용)
+            self._drawn_hands = None  # 화면에 그리는 손 랜드마크 (draw_interval마다 갱신)
+            self.last_confidence = 0.0  # 마지막으로 감지된 손의 신뢰도 (0이면 재검출 중)
+            
+            # 랜드마크 그리기 설정 (비활성 시 그리기 경로 전체 생략)
+            self._draw_frame_count = 0
+            self._cache_draw_config()
+            # 손 하나만 추적하면 단일 손 변환 경로 사용
+            self._single_hand = self.config.get('max_num_hands', 1) == 1
             logger.info("손 감지기가 초기화되었습니다.")
             
         except Exception as e:
             logger.error(f"손 감지기 초기화 실패: {e}")
             raise HandTrackingError(f"손 감지기 초기화 실패: {e}")
     
+    def _cache_draw_config(self) -> None:
+        """랜드마크 그리기 설정 캐시"""
+        self._draw_enabled = self.config.get('draw_landmarks', True)
+        self._draw_interval = max(1, self.config.get('draw_interval', 1))
+    
     def detect_hands(self, frame: np.ndarray) -> Optional[List[HandLandmarks]]:
         """
         프레임에서 손 감지
         
+        오류는 여기서 잡지 않고 호출자(손 인식 스레드)에서 한 번만 처리합니다.
+        
         Args:
             frame: 입력 프레임
             
         Returns:
             감지된 손 랜드마크 리스트
         """
-        try:
-            # MediaPipe로 손 감지
-            results = self.mediapipe_wrapper.process_frame(frame)
-            
-            # 결과 저장 (랜드마크 그리기용)
-            self.last_results = results
-            
-            if results is None:
-                return None
-            
-            # 결과를 HandLandmarks 객체로 변환
-            hand_landmarks_list = self.landmark_processor.process_results(results)
-            
-            return hand_landmarks_list
-            
-        except Exception as e:
-            logger.error(f"손 감지 중 오류: {e}")
+        # MediaPipe로 손 감지
+        results = self.mediapipe_wrapper.process_frame(frame)
+        
+        # 새 결과가 없으면 (비동기 추론 진행 중) 이전 결과를 그리기용으로 유지
+        if results is None:
             return None
+        
+        # 결과 저장 (랜드마크 그리기용)
+        self.last_results = results
+        
+        # 결과를 HandLandmarks 객체로 변환
+        if self._single_hand:
+            hand_landmarks = self.landmark_processor.process_single(results)
+            hand_landmarks_list = [hand_landmarks] if hand_landmarks else None
+        else:
+            hand_landmarks_list = self.landmark_processor.process_results(results)
+        self._last_hands = hand_landmarks_list
+        self.last_confidence = hand_landmarks_list[0].confidence if hand_landmarks_list else 0.0
+        
+        return hand_landmarks_list
     
-    def draw_landmarks(self, frame: np.ndarray, hand_landmarks: HandLandmarks) -> np.ndarray:
+    def draw_latest_landmarks(self, frame: np.ndarray) -> np.ndarray:
         """
-        손 랜드마크를 프레임에 그리기
+        가장 최근 인식 결과의 랜드마크를 프레임에 그리기
+        
+        비동기 추론 모드에서는 이전 프레임의 결과일 수 있습니다.
         
         Args:
             frame: 입력 프레임
-            hand_landmarks: 손 랜드마크
             
         Returns:
             랜드마크가 그려진 프레임
         """
+        if not self._draw_enabled:
+            return frame
+        
+        # 그릴 랜드마크는 N 프레임마다 한 번만 갱신 (깜빡임 없이 매 프레임 그리기)
+        self._draw_frame_count += 1
+        if self._draw_frame_count >= self._draw_interval:
+            self._draw_frame_count = 0
+            self._drawn_hands = self._last_hands
+        
         try:
-            # 저장된 MediaPipe 결과가 있으면 랜드마크 그리기
-            if self.last_results and self.last_results.multi_hand_landmarks:
-                # 해당 손의 랜드마크 찾기
-                for i, mp_landmarks in enumerate(self.last_results.multi_hand_landmarks):
-                    if i < len(self.last_results.multi_handedness):
-                        handedness = self.last_results.multi_handedness[i].classification[0].label
-                        # MediaPipe 래퍼를 사용하여 랜드마크 그리기
-                        frame = self.mediapipe_wrapper.draw_landmarks(
-                            frame, mp_landmarks, handedness
-                        )
-                        logger.debug(f"랜드마크 그리기 완료: {handedness}손")
-                        break  # 첫 번째 손만 그리기
+            # 이미 변환된 랜드마크 배열로 그리기 (MediaPipe 결과를 다시 읽지 않음)
+            if self._drawn_hands:
+                hand = self._drawn_hands[0]  # 첫 번째 손만 그리기
+                frame = self.mediapipe_wrapper.draw_landmarks(frame, hand.landmarks, hand.handedness)
+                logger.debug("랜드마크 그리기 완료: %s손", hand.handedness)
             
             return frame
             
@@ -108,6 +129,8 @@ class HandDetector:
         """설정 업데이트"""
         try:
             self.config = config
+            self._cache_draw_config()
+            self._single_hand = config.get('max_num_hands', 1) == 1
             self.mediapipe_wrapper.update_config(config)
             logger.info("손 감지기 설정이 업데이트되었습니다.")
             
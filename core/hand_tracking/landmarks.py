@@ -2,6 +2,7 @@
 Hand landmarks processing for Hand Tracking Trackpad application.
 """
 from dataclasses import dataclass
+from math import sqrt
 from typing import List, Optional
 import numpy as np
 
@@ -9,11 +10,17 @@ from utils.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 손가락 팁/MCP 랜드마크 인덱스 (검지, 중지, 약지, 새끼 순)
+_TIP_IDX = np.array([8, 12, 16, 20], dtype=np.intp)
+_MCP_IDX = np.array([5, 9, 13, 17], dtype=np.intp)
+_FINGER_STATE_KEYS = ('finger_1_extended', 'finger_2_extended',
+                      'finger_3_extended', 'finger_4_extended')
 
-@dataclass
+
+@dataclass(slots=True)
 class HandLandmarks:
     """손 랜드마크 데이터 클래스"""
-    landmarks: List[List[float]]
+    landmarks: np.ndarray  # (21, 3) float32 정규화 좌표 (x, y, z)
     handedness: str
     confidence: float
 
@@ -25,9 +32,12 @@ class LandmarkProcessor:
         """랜드마크 프로세서 초기화"""
         self.logger = get_logger(__name__)
     
-    def extract_landmarks(self, hand_landmarks) -> List[List[float]]:
-        """랜드마크 좌표 추출"""
-        return [[lm.x, lm.y, lm.z] for lm in hand_landmarks.landmark]
+    def extract_landmarks(self, hand_landmarks) -> np.ndarray:
+        """랜드마크 좌표 추출 ((N, 3) float32 배열)"""
+        points = hand_landmarks.landmark
+        # 원소별 배열 대입 대신 좌표를 한 번에 채움
+        coords = (value for lm in points for value in (lm.x, lm.y, lm.z))
+        return np.fromiter(coords, dtype=np.float32, count=len(points) * 3).reshape(-1, 3)
     
     def get_handedness(self, results, index: int) -> str:
         """손 방향 확인"""
@@ -41,29 +51,18 @@ class LandmarkProcessor:
             return results.multi_handedness[index].classification[0].score
         return 0.0
     
-    def get_palm_center(self, landmarks: List[List[float]]) -> List[float]:
+    def get_palm_center(self, landmarks: np.ndarray) -> np.ndarray:
         """손바닥 중심점 계산"""
         # 중지 MCP 관절 (랜드마크 9번)을 손바닥 중심으로 사용
         return landmarks[9]
     
-    def get_finger_states(self, landmarks: List[List[float]], threshold: float = 0.02) -> dict:
+    def get_finger_states(self, landmarks: np.ndarray, threshold: float = 0.02) -> dict:
         """손가락 상태 확인"""
-        # 각 손가락의 팁과 MCP 관절
-        finger_tips = [8, 12, 16, 20]  # 검지, 중지, 약지, 새끼
-        finger_mcps = [5, 9, 13, 17]   # 각 손가락의 MCP 관절
-        
-        finger_states = {}
-        
-        for i, (tip, mcp) in enumerate(zip(finger_tips, finger_mcps)):
-            tip_y = landmarks[tip][1]
-            mcp_y = landmarks[mcp][1]
-            
-            # 손가락이 펴져있으면 팁이 MCP보다 위에 있음 (y값이 작음)
-            finger_states[f'finger_{i+1}_extended'] = tip_y < (mcp_y - threshold)
-        
-        return finger_states
+        # 손가락이 펴져있으면 팁이 MCP보다 위에 있음 (y값이 작음)
+        extended = landmarks[_TIP_IDX, 1] < (landmarks[_MCP_IDX, 1] - threshold)
+        return dict(zip(_FINGER_STATE_KEYS, extended.tolist()))
     
-    def get_thumb_distances(self, landmarks: List[List[float]]) -> dict:
+    def get_thumb_distances(self, landmarks: np.ndarray) -> dict:
         """엄지-검지, 엄지-중지 거리 계산"""
         thumb_tip = landmarks[4]
         index_tip = landmarks[8]
@@ -76,11 +75,10 @@ class LandmarkProcessor:
     
     def calculate_distance(self, point1: List[float], point2: List[float]) -> float:
         """두 점 사이의 유클리드 거리 계산"""
-        return np.sqrt(
-            (point1[0] - point2[0])**2 + 
-            (point1[1] - point2[1])**2 + 
-            (point1[2] - point2[2])**2
-        )
+        dx = float(point1[0] - point2[0])
+        dy = float(point1[1] - point2[1])
+        dz = float(point1[2] - point2[2])
+        return sqrt(dx * dx + dy * dy + dz * dz)
     
     def process_results(self, results) -> Optional[List[HandLandmarks]]:
         """MediaPipe 결과를 HandLandmarks 객체로 변환"""
@@ -100,4 +98,15 @@ class LandmarkProcessor:
                 confidence=confidence
             ))
         
-        return hand_landmarks_list 
\ No newline at end of file
+        return hand_landmarks_list 
+    
+    def process_single(self, results) -> Optional[HandLandmarks]:
+        """첫 번째 손만 HandLandmarks로 변환 (max_num_hands=1 전용)"""
+        if not results.multi_hand_landmarks:
+            return None
+        
+        return HandLandmarks(
+            landmarks=self.extract_landmarks(results.multi_hand_landmarks[0]),
+            handedness=self.get_handedness(results, 0),
+            confidence=self.get_confidence(results, 0)
+        )
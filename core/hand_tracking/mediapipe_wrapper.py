@@ -1,6 +1,12 @@
 """
 MediaPipe wrapper for hand tracking.
 """
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
 import cv2
 import mediapipe as mp
 import numpy as np
@@ -10,6 +16,48 @@ from exceptions.base import HandTrackingError
 
 logger = get_logger(__name__)
 
+# 상대 경로 모델 파일의 기준 디렉터리 (PyInstaller 번들이면 번들 리소스 디렉터리)
+_APP_ROOT = Path(getattr(sys, '_MEIPASS', Path(__file__).resolve().parents[2]))
+
+# 변경 시 모델(솔버) 재생성이 필요한 설정 키
+_MODEL_CONFIG_KEYS = (
+    'model_asset_path', 'delegate', 'running_mode', 'static_image_mode', 'max_num_hands',
+    'min_detection_confidence', 'min_tracking_confidence', 'redetection_confidence'
+)
+
+# 랜드마크 인덱스별 포인트 반지름 (손가락 팁 12, PIP 10, DIP 8, 손바닥 중심 15, 나머지 6)
+_LANDMARK_RADII = (
+    6,              # 손목
+    6, 8, 10, 12,   # 엄지
+    6, 8, 10, 12,   # 검지
+    15, 8, 10, 12,  # 중지 (MCP = 손바닥 중심)
+    6, 8, 10, 12,   # 약지
+    6, 8, 10, 12    # 새끼
+)
+
+# 손 방향별 랜드마크 색상 (BGR)
+_HAND_COLORS = {
+    "Right": (0, 255, 0),  # 초록색
+    "Left": (0, 0, 255)    # 빨간색
+}
+_DEFAULT_HAND_COLOR = (0, 0, 255)
+
+# 손가락 연결선 (손목에서 각 손가락 끝까지 이어지는 체인 + 손바닥 연결)
+_FINGER_CHAINS = (
+    np.array([0, 1, 2, 3, 4], dtype=np.int32),      # 엄지
+    np.array([0, 5, 6, 7, 8], dtype=np.int32),      # 검지
+    np.array([0, 9, 10, 11, 12], dtype=np.int32),   # 중지
+    np.array([0, 13, 14, 15, 16], dtype=np.int32),  # 약지
+    np.array([0, 17, 18, 19, 20], dtype=np.int32),  # 새끼
+    np.array([5, 9, 13, 17], dtype=np.int32)        # 손바닥 연결
+)
+# 모든 체인을 한 번에 모으는 인덱스와 체인별 구간 (프레임마다 인덱싱 한 번)
+_CHAIN_INDEX = np.concatenate(_FINGER_CHAINS)
+_CHAIN_SLICES = tuple(
+    slice(end - len(chain), end)
+    for chain, end in zip(_FINGER_CHAINS, np.cumsum([len(chain) for chain in _FINGER_CHAINS]).tolist())
+)
+
 
 class MediaPipeWrapper:
     """MediaPipe 래퍼 클래스"""
@@ -23,6 +71,18 @@ class MediaPipeWrapper:
         """
         try:
             self.config = config
+            # 추론용 축소 프레임 버퍼 (첫 프레임에서 할당)
+            self._small_bgr = None
+            self._small_rgb = None
+            self._inference_size = tuple(config.get('inference_size', (256, 192)))
+            self._target_size_key = None
+            self._target_size = None
+            # 원본 크기 RGB 변환 버퍼 (축소하지 않는 경우)
+            self._rgb_buf = None
+            # OpenCL 사용 가능 시 축소/색변환을 GPU(UMat)에서 수행
+            self._use_opencl = self._check_opencl()
+            self._draw_enabled = config.get('draw_landmarks', True)
+            self._model_sig = self._model_signature(config)
             self._init_mediapipe()
             logger.info("MediaPipe 래퍼가 초기화되었습니다.")
             
@@ -31,129 +91,259 @@ class MediaPipeWrapper:
             raise HandTrackingError(f"MediaPipe 초기화 실패: {e}")
     
     def _init_mediapipe(self) -> None:
-        """MediaPipe 초기화"""
+        """MediaPipe 초기화 (모델 파일이 있으면 Tasks API, 없으면 기존 solutions API)"""
         self.mp_hands = mp.solutions.hands
+        self.mp_draw = mp.solutions.drawing_utils
+        self.hands = None
+        self.landmarker = None
+        self._last_timestamp_ms = 0
+        
+        # LIVE_STREAM 모드 결과 (MediaPipe 콜백 스레드에서 갱신)
+        self._live_stream = self.config.get('running_mode', 'live_stream') == 'live_stream'
+        self._result_lock = threading.Lock()
+        self._latest_result = None
+        
+        model_path = self._resolve_model_path(self.config.get('model_asset_path', 'models/hand_landmarker.task'))
+        if model_path.exists():
+            self.landmarker = self._create_landmarker(model_path)
+            return
+        
+        logger.info(f"Tasks 모델 파일이 없어 기존 MediaPipe Hands를 사용합니다: {model_path}")
         self.hands = self.mp_hands.Hands(
             static_image_mode=self.config.get('static_image_mode', False),
             max_num_hands=self.config.get('max_num_hands', 1),
             min_detection_confidence=self.config.get('min_detection_confidence', 0.7),
             min_tracking_confidence=self.config.get('min_tracking_confidence', 0.5)
         )
-        self.mp_draw = mp.solutions.drawing_utils
+    
+    @staticmethod
+    def _resolve_model_path(path: str) -> Path:
+        """모델 경로 해석 (상대 경로는 작업 디렉터리가 아닌 앱 루트 기준)"""
+        model_path = Path(path)
+        return model_path if model_path.is_absolute() else _APP_ROOT / model_path
+    
+    @staticmethod
+    def _model_signature(config: dict) -> tuple:
+        """모델 재생성 여부 판단용 설정 값 튜플"""
+        return tuple(config.get(key) for key in _MODEL_CONFIG_KEYS)
+    
+    def _create_landmarker(self, model_path: Path):
+        """Tasks API HandLandmarker 생성 (GPU 델리게이트 실패 시 CPU로 대체)"""
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python import vision
+        
+        if self._live_stream:
+            mode_options = {
+                'running_mode': vision.RunningMode.LIVE_STREAM,
+                'result_callback': self._on_result
+            }
+        else:
+            mode_options = {'running_mode': vision.RunningMode.VIDEO}
+        
+        def create(delegate):
+            options = vision.HandLandmarkerOptions(
+                base_options=BaseOptions(model_asset_path=str(model_path), delegate=delegate),
+                num_hands=self.config.get('max_num_hands', 1),
+                min_hand_detection_confidence=self.config.get('min_detection_confidence', 0.7),
+                # 손 존재 신뢰도가 이 값 이상이면 이전 랜드마크 ROI로 추적 (손바닥 검출 생략)
+                min_hand_presence_confidence=self.config.get('redetection_confidence', 0.5),
+                min_tracking_confidence=self.config.get('min_tracking_confidence', 0.5),
+                **mode_options
+            )
+            return vision.HandLandmarker.create_from_options(options)
+        
+        if self.config.get('delegate', 'cpu') == 'gpu':
+            try:
+                landmarker = create(BaseOptions.Delegate.GPU)
+                logger.info("MediaPipe HandLandmarker를 GPU 델리게이트로 생성했습니다.")
+                return landmarker
+            except Exception as e:
+                # GPU를 지원하지 않는 환경에서는 정상적인 대체 경로
+                logger.info(f"GPU 델리게이트를 사용할 수 없어 CPU로 대체합니다: {e}")
+        
+        landmarker = create(BaseOptions.Delegate.CPU)
+        logger.info("MediaPipe HandLandmarker를 CPU 델리게이트로 생성했습니다.")
+        return landmarker
     
     def process_frame(self, frame: np.ndarray):
-        """프레임에서 손 랜드마크 감지"""
-        try:
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            return results
-            
-        except Exception as e:
-            logger.error(f"프레임 처리 중 오류: {e}")
-            return None
+        """
+        프레임에서 손 랜드마크 감지
+        
+        LIVE_STREAM 모드에서는 추론을 요청만 하고 즉시 반환하며,
+        이전 호출 이후 완료된 새 결과가 있을 때만 그 결과를 반환합니다 (없으면 None).
+        """
+        rgb_frame = self._prepare_input(frame)
+        if self.landmarker is None:
+            return self.hands.process(rgb_frame)
+        
+        # VIDEO/LIVE_STREAM 모드는 단조 증가하는 타임스탬프(ms)가 필요
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        
+        if not self._live_stream:
+            result = self.landmarker.detect_for_video(image, timestamp_ms)
+            return self._to_legacy_results(result)
+        
+        self.landmarker.detect_async(image, timestamp_ms)
+        with self._result_lock:
+            result = self._latest_result
+            self._latest_result = None
+        return result
     
-    def draw_landmarks(self, frame: np.ndarray, hand_landmarks, handedness: str = "Right") -> np.ndarray:
-        """손 랜드마크를 프레임에 그리기"""
-        try:
-            height, width = frame.shape[:2]
-            
-            # 손 방향에 따른 색상 설정 (더 눈에 띄게)
-            if handedness == "Right":
-                color = (0, 255, 0)  # 초록색
+    def _on_result(self, result, output_image, timestamp_ms: int) -> None:
+        """LIVE_STREAM 추론 완료 콜백 (MediaPipe 스레드)"""
+        legacy_result = self._to_legacy_results(result)
+        with self._result_lock:
+            self._latest_result = legacy_result
+    
+    @staticmethod
+    def _to_legacy_results(result) -> SimpleNamespace:
+        """Tasks API 결과를 solutions API 결과 형태로 변환"""
+        return SimpleNamespace(
+            multi_hand_landmarks=[
+                SimpleNamespace(landmark=landmarks) for landmarks in result.hand_landmarks
+            ] or None,
+            multi_handedness=[
+                SimpleNamespace(classification=[
+                    SimpleNamespace(label=category.category_name, score=category.score)
+                    for category in categories
+                ])
+                for categories in result.handedness
+            ] or None
+        )
+    
+    def _prepare_input(self, frame: np.ndarray) -> np.ndarray:
+        """
+        추론 입력 준비 (한 번만 축소 후 RGB 변환)
+        
+        랜드마크는 0~1로 정규화되므로 축소해도 좌표 변환이 필요 없습니다.
+        원본 해상도 프레임은 화면 표시에 그대로 사용됩니다.
+        """
+        target_size = self._get_target_size(frame.shape[:2])
+        downscale = target_size is not None
+        if downscale:
+            width, height = target_size
+        
+        # 축소가 없으면 색 변환만 하므로 OpenCL 업로드/다운로드 없이 재사용 버퍼에 변환
+        if not downscale:
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            return self._rgb_buf
+        
+        if self._use_opencl:
+            umat = cv2.resize(cv2.UMat(frame), (width, height), interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(umat, cv2.COLOR_BGR2RGB).get()
+        
+        if self._small_bgr is None or self._small_bgr.shape[:2] != (height, width):
+            self._small_bgr = np.empty((height, width, 3), dtype=np.uint8)
+            self._small_rgb = np.empty((height, width, 3), dtype=np.uint8)
+        
+        cv2.resize(frame, (width, height), dst=self._small_bgr, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small_bgr, cv2.COLOR_BGR2RGB, dst=self._small_rgb)
+        return self._small_rgb
+    
+    def _get_target_size(self, frame_size: tuple):
+        """
+        inference_size 안에 들어가는 축소 크기 (프레임 종횡비 유지)
+        
+        종횡비가 바뀌면 손 모양이 왜곡되어 정확도가 떨어지므로 비율을 유지합니다.
+        
+        Returns:
+            (width, height) 또는 축소가 필요 없으면 None
+        """
+        if frame_size != self._target_size_key:
+            frame_height, frame_width = frame_size
+            max_width, max_height = self._inference_size
+            scale = min(max_width / frame_width, max_height / frame_height)
+            if scale >= 1.0:
+                self._target_size = None
             else:
-                color = (0, 0, 255)  # 빨간색
-            
-            logger.debug(f"랜드마크 그리기 시작: {handedness}손, 색상={color}")
-            
-            # 랜드마크 포인트 그리기
-            self._draw_landmark_points(frame, hand_landmarks, color, width, height)
-            
-            # 손가락 연결선 그리기
-            self._draw_connections(frame, hand_landmarks, color, width, height)
-            
-            # 손바닥 중심점 강조
-            self._draw_palm_center(frame, hand_landmarks, width, height)
-            
-            logger.debug(f"랜드마크 그리기 완료: {handedness}손")
-            return frame
-            
+                self._target_size = (max(1, round(frame_width * scale)), max(1, round(frame_height * scale)))
+            self._target_size_key = frame_size
+        return self._target_size
+    
+    def _check_opencl(self) -> bool:
+        """OpenCL(UMat) 경로 사용 가능 여부 확인"""
+        if not self.config.get('use_opencl', True):
+            return False
+        try:
+            enabled = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
         except Exception as e:
-            logger.error(f"랜드마크 그리기 중 오류: {e}")
+            logger.warning(f"OpenCL 상태 확인 실패: {e}")
+            return False
+        logger.info(f"OpenCL 전처리 사용: {enabled}")
+        return enabled
+    
+    def draw_landmarks(self, frame: np.ndarray, landmarks: np.ndarray, handedness: str = "Right") -> np.ndarray:
+        """손 랜드마크 ((N, 3) 정규화 좌표 배열)를 프레임에 그리기"""
+        if not self._draw_enabled:
             return frame
+        
+        height, width = frame.shape[:2]
+        
+        # 손 방향에 따른 색상 설정 (더 눈에 띄게)
+        color = _HAND_COLORS.get(handedness, _DEFAULT_HAND_COLOR)
+        
+        logger.debug("랜드마크 그리기 시작: %s손, 색상=%s", handedness, color)
+        
+        # 랜드마크 픽셀 좌표를 한 번에 계산
+        points = self._to_pixel_points(landmarks, width, height)
+        
+        # 랜드마크 포인트 그리기
+        self._draw_landmark_points(frame, points, color)
+        
+        # 손가락 연결선 그리기
+        self._draw_connections(frame, points, color)
+        
+        # 손바닥 중심점 강조
+        self._draw_palm_center(frame, points)
+        
+        logger.debug("랜드마크 그리기 완료: %s손", handedness)
+        return frame
     
-    def _draw_landmark_points(self, frame: np.ndarray, hand_landmarks, 
-                            color: tuple, width: int, height: int) -> None:
+    @staticmethod
+    def _to_pixel_points(landmarks: np.ndarray, width: int, height: int) -> np.ndarray:
+        """정규화 랜드마크를 정수 픽셀 좌표 (N, 2) int32 배열로 변환"""
+        return np.rint(landmarks[:, :2] * (width, height)).astype(np.int32)
+    
+    def _draw_landmark_points(self, frame: np.ndarray, points: np.ndarray, color: tuple) -> None:
         """랜드마크 포인트 그리기"""
-        for i, landmark in enumerate(hand_landmarks.landmark):
-            x = int(landmark.x * width)
-            y = int(landmark.y * height)
-            
-            # 랜드마크 포인트 크기 설정 (더 크게)
-            if i in [4, 8, 12, 16, 20]:  # 손가락 팁
-                radius = 12
-            elif i in [3, 7, 11, 15, 19]:  # 손가락 PIP
-                radius = 10
-            elif i in [2, 6, 10, 14, 18]:  # 손가락 DIP
-                radius = 8
-            elif i == 9:  # 손바닥 중심
-                radius = 15
-            else:  # 기타 포인트
-                radius = 6
-            
+        for (x, y), radius in zip(points.tolist(), _LANDMARK_RADII):
             # 더 두꺼운 선으로 그리기
             cv2.circle(frame, (x, y), radius, color, -1)
             cv2.circle(frame, (x, y), radius, (255, 255, 255), 2)  # 흰색 테두리
     
-    def _draw_connections(self, frame: np.ndarray, hand_landmarks, 
-                         color: tuple, width: int, height: int) -> None:
-        """손가락 연결선 그리기"""
-        connections = [
-            # 엄지
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # 검지
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # 중지
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # 약지
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # 새끼
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # 손바닥 연결
-            (5, 9), (9, 13), (13, 17)
-        ]
-        
-        for start_idx, end_idx in connections:
-            if start_idx < len(hand_landmarks.landmark) and end_idx < len(hand_landmarks.landmark):
-                start_point = (
-                    int(hand_landmarks.landmark[start_idx].x * width),
-                    int(hand_landmarks.landmark[start_idx].y * height)
-                )
-                end_point = (
-                    int(hand_landmarks.landmark[end_idx].x * width),
-                    int(hand_landmarks.landmark[end_idx].y * height)
-                )
-                
-                cv2.line(frame, start_point, end_point, color, 3)
-    
-    def _draw_palm_center(self, frame: np.ndarray, hand_landmarks, 
-                         width: int, height: int) -> None:
+    def _draw_connections(self, frame: np.ndarray, points: np.ndarray, color: tuple) -> None:
+        """손가락 연결선 그리기 (손가락별 폴리라인을 한 번의 호출로 그림)"""
+        if len(points) < len(_LANDMARK_RADII):
+            return
+        chain_points = points[_CHAIN_INDEX]
+        cv2.polylines(frame, [chain_points[part] for part in _CHAIN_SLICES], False, color, 3)
+    
+    def _draw_palm_center(self, frame: np.ndarray, points: np.ndarray) -> None:
         """손바닥 중심점 강조"""
-        palm_center = hand_landmarks.landmark[9]  # 중지 MCP
-        palm_x = int(palm_center.x * width)
-        palm_y = int(palm_center.y * height)
-        cv2.circle(frame, (palm_x, palm_y), 20, (0, 255, 255), -1)  # 노란색 (더 크게)
-        cv2.circle(frame, (palm_x, palm_y), 20, (255, 255, 255), 3)  # 흰색 테두리 (더 두껍게)
+        palm_center = tuple(points[9].tolist())  # 중지 MCP
+        cv2.circle(frame, palm_center, 20, (0, 255, 255), -1)  # 노란색 (더 크게)
+        cv2.circle(frame, palm_center, 20, (255, 255, 255), 3)  # 흰색 테두리 (더 두껍게)
     
     def update_config(self, config: dict) -> None:
         """설정 업데이트"""
         try:
             self.config = config
-            self.hands = self.mp_hands.Hands(
-                static_image_mode=config.get('static_image_mode', False),
-                max_num_hands=config.get('max_num_hands', 1),
-                min_detection_confidence=config.get('min_detection_confidence', 0.7),
-                min_tracking_confidence=config.get('min_tracking_confidence', 0.5)
-            )
+            self._inference_size = tuple(config.get('inference_size', (256, 192)))
+            self._target_size_key = None
+            self._use_opencl = self._check_opencl()
+            self._draw_enabled = config.get('draw_landmarks', True)
+            
+            # 모델 관련 설정이 그대로면 기존 솔버 유지 (모델 그래프 재로딩 생략)
+            model_sig = self._model_signature(config)
+            if model_sig != self._model_sig:
+                self.release()
+                self._model_sig = model_sig
+                self._init_mediapipe()
+                logger.info("MediaPipe 모델을 다시 생성했습니다.")
             logger.info("MediaPipe 설정이 업데이트되었습니다.")
             
         except Exception as e:
@@ -162,9 +352,12 @@ class MediaPipeWrapper:
     def release(self) -> None:
         """리소스 해제"""
         try:
-            if hasattr(self, 'hands'):
+            if getattr(self, 'hands', None):
                 self.hands.close()
                 logger.info("MediaPipe Hands 리소스 해제됨")
+            if getattr(self, 'landmarker', None):
+                self.landmarker.close()
+                logger.info("MediaPipe HandLandmarker 리소스 해제됨")
             
         except Exception as e:
             logger.error(f"MediaPipe 리소스 해제 중 오류: {e}") 
\ No newline at end of file
@@ -1,23 +1,200 @@
 """
 Mouse controller for Hand Tracking Trackpad application.
 """
-import pyautogui
+import logging
+import threading
 import time
+import numpy as np
 import sys
 import subprocess
 import os
-from typing import Tuple
+from collections import deque
+from typing import Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 
 from utils.logging.logger import get_logger
 from exceptions.base import MouseError
-from core.camera.capture import CameraCapture
 from core.gesture.types import GestureType
+from . import native
+from .kernels import motion_step, clamp_position
+
+if TYPE_CHECKING:
+    from core.camera.capture import CameraCapture
 
 logger = get_logger(__name__)
 
+# 카메라 정보가 없을 때 사용할 웹캠 해상도
+_DEFAULT_CAMERA_SIZE = (480, 360)
+
+# 무시할 최소 손바닥 변화량 (정규화 좌표)
+_MIN_MOVEMENT = 0.001
+
+# 화면 가장자리 여유 픽셀 (PyAutoGUI fail-safe 방지)
+_SCREEN_MARGIN = 1
+
+# macOS 접근성 권한 확인 결과 캐시 (None이면 아직 확인 전 또는 확인 불가)
+_ACCESSIBILITY_OK = None
+_ACCESSIBILITY_CHECKED_AT = 0.0
+
+# 권한 없음 확인 결과를 신뢰하는 시간 (초, 이후 클릭 시 다시 확인)
+_ACCESSIBILITY_RECHECK_INTERVAL = 10.0
+
+# 스와이프 방향별 (동작 이름, 단축키, 로그 메시지)
+_SWIPE_ACTIONS = {
+    "left": ("스와이프 왼쪽", ('ctrl', 'right'), "스와이프 왼쪽 - 다음 데스크탑으로 이동"),
+    "right": ("스와이프 오른쪽", ('ctrl', 'left'), "스와이프 오른쪽 - 이전 데스크탑으로 이동"),
+    "up": ("스와이프 위", ('ctrl', 'up'), "스와이프 위 - 미션 컨트롤 시작"),
+    "down": ("스와이프 아래", ('ctrl', 'down'), "스와이프 아래 - 미션 컨트롤 종료")
+}
+
+
+def _is_accessibility_trusted(prompt: bool = False, allow_subprocess: bool = True) -> bool:
+    """
+    macOS 접근성 권한 여부 확인 (결과는 모듈 수준에 캐시)
+    
+    HIServices의 AXIsProcessTrustedWithOptions를 프로세스 안에서 직접 호출하고,
+    pyobjc를 사용할 수 없을 때만 osascript 키 입력 테스트로 대체합니다.
+    
+    Args:
+        prompt: 권한이 없을 때 시스템 권한 요청 창 표시 여부
+        allow_subprocess: pyobjc가 없을 때 osascript 확인 허용 여부
+            (아니면 확인 불가로 보고 허용)
+    
+    Returns:
+        권한 여부 (시간 초과 등으로 확인할 수 없으면 True)
+    """
+    global _ACCESSIBILITY_OK, _ACCESSIBILITY_CHECKED_AT
+    if sys.platform != "darwin":
+        _ACCESSIBILITY_OK = True
+        return True
+    
+    try:
+        from HIServices import AXIsProcessTrustedWithOptions, kAXTrustedCheckOptionPrompt
+        _ACCESSIBILITY_OK = bool(AXIsProcessTrustedWithOptions({kAXTrustedCheckOptionPrompt: prompt}))
+    except ImportError:
+        if not allow_subprocess:
+            # osascript 확인은 느리므로 생략하고 만료된 결과는 확인 불가로 취급
+            _ACCESSIBILITY_OK = None
+            return True
+        try:
+            result = subprocess.run([
+                'osascript', '-e', 
+                'tell application "System Events" to keystroke "a"'
+            ], capture_output=True, timeout=5)
+        except subprocess.TimeoutExpired:
+            # 시간 초과는 권한 없음이 아니라 확인 불가로 취급
+            logger.warning("접근성 권한 확인 중 시간 초과")
+            _ACCESSIBILITY_OK = None
+            return True
+        _ACCESSIBILITY_OK = result.returncode == 0
+    _ACCESSIBILITY_CHECKED_AT = time.monotonic()
+    return _ACCESSIBILITY_OK
+
+
+class _MouseIOThread(threading.Thread):
+    """마우스 입력 실행 스레드 (트래킹 루프가 OS 입력 호출에 막히지 않도록 분리)"""
+    
+    def __init__(self, controller: "MouseController", move_rate_hz: float):
+        super().__init__(name="MouseIOThread", daemon=True)
+        self.controller = controller
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        # 커서 이동 최소 간격 (간격 안에 들어온 이동량은 합쳐서 한 번에 이동)
+        self.set_move_rate(move_rate_hz)
+        self._next_move_time = 0.0
+        self._move_lock = threading.Lock()
+        self._pending_move_x = 0
+        self._pending_move_y = 0
+        # 클릭/스크롤/단축키 등 순서대로 실행할 동작
+        self._actions = deque()
+    
+    def set_move_rate(self, move_rate_hz: float) -> None:
+        """초당 최대 커서 이동 횟수 설정 (0 이하면 제한 없음)"""
+        self._move_interval = 1.0 / move_rate_hz if move_rate_hz > 0 else 0.0
+    
+    def add_move(self, move_x: int, move_y: int) -> None:
+        """커서 상대 이동 요청"""
+        with self._move_lock:
+            self._pending_move_x += move_x
+            self._pending_move_y += move_y
+        self._wake_event.set()
+    
+    def submit(self, description: str, func, *args) -> None:
+        """마우스/키보드 동작 실행 요청"""
+        self._actions.append((description, func, args))
+        self._wake_event.set()
+    
+    def clear(self) -> None:
+        """대기 중인 이동/동작 취소"""
+        with self._move_lock:
+            self._pending_move_x = 0
+            self._pending_move_y = 0
+        self._actions.clear()
+    
+    def run(self) -> None:
+        """요청된 이동을 먼저 적용하고 대기 중인 동작을 순서대로 실행"""
+        while not self._stop_event.is_set():
+            # 이동이 밀려 있으면 다음 이동 시각까지만 대기
+            timeout = 0.5
+            if self._pending_move_x or self._pending_move_y:
+                timeout = max(0.0, self._next_move_time - time.perf_counter())
+            self._wake_event.wait(timeout)
+            self._wake_event.clear()
+            
+            # 동작이 대기 중이면 순서 보장을 위해 간격과 관계없이 이동 먼저 적용
+            now = time.perf_counter()
+            if now >= self._next_move_time or self._actions:
+                with self._move_lock:
+                    move_x, move_y = self._pending_move_x, self._pending_move_y
+                    self._pending_move_x = 0
+                    self._pending_move_y = 0
+                if move_x or move_y:
+                    self._apply_move(move_x, move_y)
+                    self._next_move_time = now + self._move_interval
+            
+            while self._actions:
+                description, func, args = self._actions.popleft()
+                try:
+                    func(*args)
+                except Exception as e:
+                    logger.error(f"{description} 실패: {e}")
+    
+    def _apply_move(self, move_x: int, move_y: int) -> None:
+        """현재 커서 위치 기준 상대 이동"""
+        controller = self.controller
+        try:
+            current_mouse_x, current_mouse_y = native.get_position()
+            
+            # 화면 범위 내로 제한 (화면 가장자리에서 1픽셀 여유, PyAutoGUI fail-safe 방지)
+            new_x, new_y = clamp_position(
+                current_mouse_x + move_x, current_mouse_y + move_y,
+                controller.screen_width - 1, controller.screen_height - 1, _SCREEN_MARGIN
+            )
+            
+            native.move_to(new_x, new_y)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("마우스 이동 성공: (%d, %d) -> (%d, %d)",
+                             current_mouse_x, current_mouse_y, new_x, new_y)
+            
+            # 현재 상태 업데이트
+            controller.current_state.x = new_x
+            controller.current_state.y = new_y
+            
+        except Exception as move_error:
+            logger.error(f"마우스 이동 실패: {move_error}")
+            # 권한 재확인
+            if not controller._check_mouse_permission():
+                logger.error("마우스 제어 권한이 없습니다. 접근성 설정을 확인해주세요.")
+    
+    def stop(self) -> None:
+        """입력 실행 스레드 정지"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
+
 
-@dataclass
+@dataclass(slots=True)
 class MouseState:
     """마우스 상태 데이터 클래스"""
     x: int
@@ -29,12 +206,24 @@ class MouseState:
     is_swiping: bool
     swipe_direction: str
     scroll_direction: str
+    
+    def reset(self) -> None:
+        """모든 필드를 초기값으로 되돌림"""
+        self.x = 0
+        self.y = 0
+        self.is_clicking = False
+        self.is_right_clicking = False
+        self.is_double_clicking = False
+        self.is_scrolling = False
+        self.is_swiping = False
+        self.swipe_direction = ""
+        self.scroll_direction = ""
 
 
 class MouseController:
     """마우스 제어 클래스"""
     
-    def __init__(self, camera_capture: CameraCapture, config_manager):
+    def __init__(self, camera_capture: "CameraCapture", config_manager):
         """
         마우스 컨트롤러 초기화
         
@@ -46,35 +235,32 @@ class MouseController:
             # macOS 접근성 권한 확인
             self._check_accessibility_permissions()
             
+            # 카메라 캡처 참조 저장 (장치를 열 때마다 실제 해상도를 통지받음)
+            self.camera_capture = camera_capture
+            if camera_capture:
+                self._camera_size = camera_capture.get_actual_resolution()
+                camera_capture.add_resolution_listener(self._on_camera_resolution)
+            else:
+                self._camera_size = _DEFAULT_CAMERA_SIZE
+            
             # 화면 크기 가져오기
-            self.screen_width, self.screen_height = pyautogui.size()
+            self._set_screen_size(*native.screen_size())
             logger.info(f"화면 크기: {self.screen_width}x{self.screen_height}")
             
-            # 카메라 캡처 참조 저장
-            self.camera_capture = camera_capture
-            
             # 설정 관리자 저장
             self.config_manager = config_manager
             
-            # 마우스 설정
-            pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동하면 중단
-            pyautogui.PAUSE = 0.001    # 각 동작 사이의 지연 시간
-            
-            # macOS에서 키보드 입력 안정성을 위한 설정
-            pyautogui.MINIMUM_DURATION = 0.1  # 최소 키 입력 지속 시간
-            pyautogui.MINIMUM_SLEEP = 0.1     # 최소 대기 시간
-            
-            # 이전 손바닥 위치 저장 (상대적 이동을 위해)
-            self.prev_palm_x = None
-            self.prev_palm_y = None
+            # 이전 손바닥 위치 (x, y) 저장 (상대적 이동을 위해)
+            self._prev_palm = np.zeros(2, dtype=np.float64)
             
             # 초기화 플래그
             self.is_initialized = False
             
-            # 부드러운 이동을 위한 변수들
-            self.smoothed_x = 0.0
-            self.smoothed_y = 0.0
-            self.last_move_time = time.time()
+            # 부드러운 이동을 위한 변수들 (x, y)
+            self._smoothed = np.zeros(2, dtype=np.float64)
+            
+            # JIT 커널 미리 컴파일 (첫 이동 지연 방지)
+            motion_step(np.zeros(2), np.zeros(2), 0.0, 0.0, True, 0.4, 1.0, 1.0, _MIN_MOVEMENT)
             
             # 마우스 상태
             self.current_state = MouseState(
@@ -91,24 +277,51 @@ class MouseController:
             # 권한 테스트
             self._test_mouse_permissions()
             
+            # 마우스 입력 실행 스레드 시작
+            gesture_config = config_manager.get_gesture_config()
+            self._scroll_amount = gesture_config.get('scroll_amount', 5)
+            self._io_thread = _MouseIOThread(self, gesture_config.get('move_rate_hz', 60))
+            self._io_thread.start()
+            
             logger.info("마우스 컨트롤러가 초기화되었습니다.")
             
         except Exception as e:
             logger.error(f"마우스 컨트롤러 초기화 실패: {e}")
             raise MouseError(f"마우스 컨트롤러 초기화 실패: {e}")
     
+    def _set_screen_size(self, width: int, height: int) -> None:
+        """화면 크기 갱신"""
+        self.screen_width, self.screen_height = width, height
+        self._update_screen_scale()
+    
+    def _on_camera_resolution(self, width: int, height: int) -> None:
+        """카메라 장치가 열릴 때 실제 해상도 반영 (카메라 콜백)"""
+        self._camera_size = (width, height)
+        self._update_screen_scale()
+    
+    def _update_screen_scale(self) -> None:
+        """
+        정규화 변화량 → 픽셀 이동량 배율 계산
+        
+        실제 웹캠 해상도 기반 1:1 비례 감도: 웹캠에서 1cm 이동할 때 화면에서도
+        같은 비율로 이동하도록 화면 크기에 화면/웹캠 비율을 곱합니다.
+        """
+        camera_width, camera_height = self._camera_size
+        self._screen_scale = (self.screen_width * self.screen_width / camera_width,
+                              self.screen_height * self.screen_height / camera_height)
+    
     def _test_mouse_permissions(self) -> None:
         """마우스 권한 테스트"""
         try:
             # 현재 마우스 위치 가져오기
-            current_pos = pyautogui.position()
+            current_pos = native.get_position()
             logger.info(f"현재 마우스 위치: {current_pos}")
             
             # 작은 이동 테스트 (1픽셀)
             test_x, test_y = current_pos
-            pyautogui.moveTo(test_x + 1, test_y, duration=0.001)
+            native.move_to(test_x + 1, test_y)
             time.sleep(0.001)
-            pyautogui.moveTo(test_x, test_y, duration=0.001)
+            native.move_to(test_x, test_y)
             
             logger.info("✅ 마우스 권한 테스트 성공")
             
@@ -118,6 +331,9 @@ class MouseController:
     
     def _check_accessibility_permissions(self) -> None:
         """macOS 접근성 권한 확인 및 안내"""
+        if _ACCESSIBILITY_OK:
+            # 이미 권한이 확인되었으면 재확인 생략 (컨트롤러 재생성 시)
+            return
         if sys.platform == "darwin":  # macOS
             try:
                 # 앱이 빌드된 앱인지 확인
@@ -138,13 +354,8 @@ class MouseController:
     def _check_bundled_app_permissions(self) -> None:
         """빌드된 앱의 접근성 권한 확인"""
         try:
-            # 1. 접근성 권한 확인
-            result = subprocess.run([
-                'osascript', '-e', 
-                'tell application "System Events" to keystroke "a"'
-            ], capture_output=True, timeout=5)
-            
-            if result.returncode != 0:
+            # 1. 접근성 권한 확인 (권한이 없으면 시스템 요청 창 표시)
+            if not _is_accessibility_trusted(prompt=True):
                 logger.error("❌ 접근성 권한이 없습니다!")
                 logger.error("빌드된 앱의 경우 다음 단계를 따라주세요:")
                 logger.error("1. 시스템 환경설정 > 보안 및 개인정보 보호 > 개인정보 보호 > 접근성")
@@ -160,20 +371,13 @@ class MouseController:
             else:
                 logger.info("✅ 접근성 권한이 확인되었습니다.")
                 
-        except subprocess.TimeoutExpired:
-            logger.warning("접근성 권한 확인 중 시간 초과")
         except Exception as e:
             logger.warning(f"접근성 권한 확인 실패: {e}")
     
     def _check_script_permissions(self) -> None:
         """스크립트 실행 시 권한 확인"""
         try:
-            result = subprocess.run([
-                'osascript', '-e', 
-                'tell application "System Events" to keystroke "a"'
-            ], capture_output=True, timeout=5)
-            
-            if result.returncode != 0:
+            if not _is_accessibility_trusted(prompt=True):
                 logger.warning("⚠️  접근성 권한이 필요합니다!")
                 logger.warning("시스템 환경설정 > 보안 및 개인정보 보호 > 개인정보 보호 > 접근성에서 Terminal 또는 Python을 추가해주세요.")
                 
@@ -182,8 +386,6 @@ class MouseController:
             else:
                 logger.info("✅ 접근성 권한이 확인되었습니다.")
                 
-        except subprocess.TimeoutExpired:
-            logger.warning("접근성 권한 확인 중 시간 초과")
         except Exception as e:
             logger.warning(f"접근성 권한 확인 실패: {e}")
     
@@ -197,123 +399,62 @@ class MouseController:
             logger.error(f"시스템 환경설정 열기 실패: {e}")
             logger.info("수동으로 시스템 환경설정 > 보안 및 개인정보 보호 > 개인정보 보호 > 접근성에서 SkyTouch를 추가해주세요.")
     
-    def update_mouse_position(self, palm_center: list, gesture_mode: GestureType = GestureType.CLICK, 
+    def update_mouse_position(self, palm_center: Tuple[float, float, float], gesture_mode: GestureType = GestureType.CLICK, 
                             smoothing: float = 0.5, sensitivity: float = 1.5,
                             invert_x: bool = False, invert_y: bool = False) -> None:
         """
         손바닥 위치에 따라 마우스 커서 위치 업데이트
         
         Args:
-            palm_center: 손바닥 중심점 [x, y, z]
+            palm_center: 손바닥 중심점 (x, y, z)
             gesture_mode: 제스처 모드 ("click", "scroll", "swipe", "move")
             smoothing: 스무딩 팩터 (0.0 ~ 1.0)
             sensitivity: 감도
             invert_x: X축 좌우 반전
             invert_y: Y축 상하 반전
         """
-        try:
-            # 현재 손바닥 위치 (0~1 범위)
-            current_palm_x = palm_center[0]
-            current_palm_y = palm_center[1]
-            
-            # 좌우/상하 반전 적용
-            if invert_x:
-                current_palm_x = 1.0 - current_palm_x
-            if invert_y:
-                current_palm_y = 1.0 - current_palm_y
-            
-            # 첫 번째 호출이면 초기화
-            if not self.is_initialized:
-                self.prev_palm_x = current_palm_x
-                self.prev_palm_y = current_palm_y
-                self.is_initialized = True
-                logger.debug("마우스 컨트롤러 초기화 완료")
-                return
-            
-            # 손바닥 위치 변화량 계산
-            delta_x = current_palm_x - self.prev_palm_x
-            delta_y = current_palm_y - self.prev_palm_y
-            
-            # 현재 시간 가져오기
-            current_time = time.time()
-            
-            # 이동 모드가 아니면 마우스 이동 안함
-            if gesture_mode != GestureType.MOVE:
-                logger.debug(f"{gesture_mode.value} 모드 - 마우스 이동 중단")
-                # 이전 손바닥 위치 업데이트 (중요!)
-                self.prev_palm_x = current_palm_x
-                self.prev_palm_y = current_palm_y
-                return
-            
-            # 부드러운 스무딩 적용 (지수 이동 평균)
-            smoothing_factor = smoothing * 0.8  # 더 부드럽게
-            self.smoothed_x = self.smoothed_x * (1 - smoothing_factor) + delta_x * smoothing_factor
-            self.smoothed_y = self.smoothed_y * (1 - smoothing_factor) + delta_y * smoothing_factor
-            
-            # 최소 이동량 임계값 (너무 작은 움직임 무시)
-            min_movement_threshold = 0.001
-            if abs(self.smoothed_x) < min_movement_threshold and abs(self.smoothed_y) < min_movement_threshold:
-                # 이전 손바닥 위치 업데이트
-                self.prev_palm_x = current_palm_x
-                self.prev_palm_y = current_palm_y
-                return
-            
-            # 실제 웹캠 해상도 기반 1:1 비례 감도 계산
-            if self.camera_capture:
-                camera_width, camera_height = self.camera_capture.get_actual_resolution()
-            else:
-                camera_width = 480
-                camera_height = 360
-            
-            # 웹캠에서 1cm 이동할 때 화면에서도 같은 비율로 이동하도록 감도 계산
-            auto_sensitivity_x = self.screen_width / camera_width
-            auto_sensitivity_y = self.screen_height / camera_height
-            
-            # 사용자 설정 감도와 자동 계산 감도를 곱함
-            final_sensitivity_x = auto_sensitivity_x * sensitivity
-            final_sensitivity_y = auto_sensitivity_y * sensitivity
-            
-            # 화면 크기에 비례한 이동량 계산 (부드러운 값 사용)
-            move_x = int(self.smoothed_x * self.screen_width * final_sensitivity_x)
-            move_y = int(self.smoothed_y * self.screen_height * final_sensitivity_y)
-            
-            # 감도 디버그 로그 (주기적으로 출력)
-            if abs(move_x) > 0 or abs(move_y) > 0:
-                logger.debug(f"부드러운 이동: smoothed=({self.smoothed_x:.3f}, {self.smoothed_y:.3f}), sensitivity=({final_sensitivity_x:.2f}, {final_sensitivity_y:.2f}), move=({move_x}, {move_y})")
-            
-            # 현재 마우스 위치 가져오기
-            current_mouse_x, current_mouse_y = pyautogui.position()
-            
-            # 새로운 마우스 위치 계산
-            new_x = current_mouse_x + move_x
-            new_y = current_mouse_y + move_y
-            
-            # 화면 범위 내로 제한 (PyAutoGUI fail-safe 방지)
-            margin = 1  # 화면 가장자리에서 1픽셀 여유 (fail-safe 방지)
-            new_x = max(margin, min(new_x, self.screen_width - margin - 1))
-            new_y = max(margin, min(new_y, self.screen_height - margin - 1))
-            
-            # 마우스 이동 시도
-            try:
-                pyautogui.moveTo(new_x, new_y, duration=0.001)
-                logger.debug(f"마우스 이동 성공: ({current_mouse_x}, {current_mouse_y}) -> ({new_x}, {new_y})")
-            except Exception as move_error:
-                logger.error(f"마우스 이동 실패: {move_error}")
-                # 권한 재확인
-                if not self._check_mouse_permission():
-                    logger.error("마우스 제어 권한이 없습니다. 접근성 설정을 확인해주세요.")
-                    return
-            
-            # 이전 손바닥 위치 업데이트
-            self.prev_palm_x = current_palm_x
-            self.prev_palm_y = current_palm_y
-            
-            # 현재 상태 업데이트
-            self.current_state.x = new_x
-            self.current_state.y = new_y
-            
-        except Exception as e:
-            logger.error(f"마우스 위치 업데이트 중 오류: {e}")
+        # 현재 손바닥 위치 (0~1 범위)
+        current_palm_x = palm_center[0]
+        current_palm_y = palm_center[1]
+        
+        # 좌우/상하 반전 적용
+        if invert_x:
+            current_palm_x = 1.0 - current_palm_x
+        if invert_y:
+            current_palm_y = 1.0 - current_palm_y
+        
+        # 이동 모드가 아니면 위치만 갱신하고 종료 (대부분의 프레임)
+        if gesture_mode is not GestureType.MOVE:
+            self._prev_palm[0] = current_palm_x
+            self._prev_palm[1] = current_palm_y
+            self.is_initialized = True
+            return
+        
+        # 첫 번째 호출이면 초기화
+        if not self.is_initialized:
+            self._prev_palm[0] = current_palm_x
+            self._prev_palm[1] = current_palm_y
+            self.is_initialized = True
+            logger.debug("마우스 컨트롤러 초기화 완료")
+            return
+        
+        # 변화량 → 스무딩 → 임계값 → 픽셀 이동량
+        move_x, move_y, moved = motion_step(
+            self._prev_palm, self._smoothed, current_palm_x, current_palm_y, True,
+            smoothing * 0.8,  # 더 부드럽게
+            self._screen_scale[0] * sensitivity, self._screen_scale[1] * sensitivity,
+            _MIN_MOVEMENT
+        )
+        if not moved:
+            return
+        
+        # 감도 디버그 로그
+        if (move_x or move_y) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("부드러운 이동: smoothed=(%.3f, %.3f), move=(%d, %d)",
+                         self._smoothed[0], self._smoothed[1], move_x, move_y)
+        
+        # 실제 이동은 입력 스레드에서 수행 (밀린 이동량은 합쳐짐)
+        self._io_thread.add_move(move_x, move_y)
     
     def handle_click(self, is_clicking: bool) -> None:
         """
@@ -322,36 +463,31 @@ class MouseController:
         Args:
             is_clicking: 클릭 상태
         """
-        try:
-            if is_clicking and not self.current_state.is_clicking:
-                # 권한 확인
-                if not self._check_mouse_permission():
-                    logger.warning("마우스 제어 권한이 없어 클릭을 건너뜁니다.")
-                    return
-                    
-                pyautogui.click()
-                self.current_state.is_clicking = True
-                logger.info(f"마우스 클릭 실행 - 위치: ({self.current_state.x}, {self.current_state.y})")
-            elif not is_clicking and self.current_state.is_clicking:
-                self.current_state.is_clicking = False
-                logger.debug("클릭 상태 해제")
+        if is_clicking and not self.current_state.is_clicking:
+            # 권한 확인
+            if not self._check_mouse_permission():
+                logger.warning("마우스 제어 권한이 없어 클릭을 건너뜁니다.")
+                return
                 
-        except Exception as e:
-            logger.error(f"클릭 처리 중 오류: {e}")
+            self._io_thread.submit("마우스 클릭", native.click)
+            self.current_state.is_clicking = True
+            logger.info("마우스 클릭 실행 - 위치: (%d, %d)", self.current_state.x, self.current_state.y)
+        elif not is_clicking and self.current_state.is_clicking:
+            self.current_state.is_clicking = False
+            logger.debug("클릭 상태 해제")
     
     def _check_mouse_permission(self) -> bool:
-        """마우스 제어 권한 확인"""
-        if sys.platform == "darwin":  # macOS
-            try:
-                # 간단한 마우스 위치 조회로 권한 확인
-                current_pos = pyautogui.position()
-                # 실제로 마우스를 움직여보기 (1픽셀만)
-                pyautogui.moveRel(0, 0, duration=0)
-                return True
-            except Exception as e:
-                logger.warning(f"마우스 제어 권한이 없습니다: {e}")
-                return False
-        return True
+        """마우스 제어 권한 확인 (권한 없음 결과는 일정 시간 동안만 캐시 사용)"""
+        if _ACCESSIBILITY_OK is not False or sys.platform != "darwin":
+            return True
+        if time.monotonic() - _ACCESSIBILITY_CHECKED_AT < _ACCESSIBILITY_RECHECK_INTERVAL:
+            return False
+        try:
+            # 사용자가 실행 중에 권한을 줄 수 있으므로 캐시가 만료되면 다시 확인
+            return _is_accessibility_trusted(allow_subprocess=False)
+        except Exception as e:
+            logger.warning(f"마우스 제어 권한이 없습니다: {e}")
+            return False
     
     def handle_right_click(self, is_right_clicking: bool) -> None:
         """
@@ -360,22 +496,18 @@ class MouseController:
         Args:
             is_right_clicking: 우클릭 상태
         """
-        try:
-            if is_right_clicking and not self.current_state.is_right_clicking:
-                # 권한 확인
-                if not self._check_mouse_permission():
-                    logger.warning("마우스 제어 권한이 없어 우클릭을 건너뜁니다.")
-                    return
-                    
-                pyautogui.rightClick()
-                self.current_state.is_right_clicking = True
-                logger.info(f"마우스 우클릭 실행 - 위치: ({self.current_state.x}, {self.current_state.y})")
-            elif not is_right_clicking and self.current_state.is_right_clicking:
-                self.current_state.is_right_clicking = False
-                logger.debug("우클릭 상태 해제")
+        if is_right_clicking and not self.current_state.is_right_clicking:
+            # 권한 확인
+            if not self._check_mouse_permission():
+                logger.warning("마우스 제어 권한이 없어 우클릭을 건너뜁니다.")
+                return
                 
-        except Exception as e:
-            logger.error(f"우클릭 처리 중 오류: {e}")
+            self._io_thread.submit("마우스 우클릭", native.click, 'right')
+            self.current_state.is_right_clicking = True
+            logger.info("마우스 우클릭 실행 - 위치: (%d, %d)", self.current_state.x, self.current_state.y)
+        elif not is_right_clicking and self.current_state.is_right_clicking:
+            self.current_state.is_right_clicking = False
+            logger.debug("우클릭 상태 해제")
     
     def handle_double_click(self, is_double_clicking: bool) -> None:
         """
@@ -384,58 +516,49 @@ class MouseController:
         Args:
             is_double_clicking: 더블클릭 상태
         """
-        try:
-            if is_double_clicking and not self.current_state.is_double_clicking:
-                pyautogui.doubleClick()
-                self.current_state.is_double_clicking = True
-                logger.info(f"마우스 더블클릭 실행 - 위치: ({self.current_state.x}, {self.current_state.y})")
-            elif not is_double_clicking and self.current_state.is_double_clicking:
-                self.current_state.is_double_clicking = False
-                logger.debug("더블클릭 상태 해제")
-                
-        except Exception as e:
-            logger.error(f"더블클릭 처리 중 오류: {e}")
+        if is_double_clicking and not self.current_state.is_double_clicking:
+            self._io_thread.submit("마우스 더블클릭", native.double_click)
+            self.current_state.is_double_clicking = True
+            logger.info("마우스 더블클릭 실행 - 위치: (%d, %d)", self.current_state.x, self.current_state.y)
+        elif not is_double_clicking and self.current_state.is_double_clicking:
+            self.current_state.is_double_clicking = False
+            logger.debug("더블클릭 상태 해제")
     
     def handle_scroll(self, is_scrolling: bool, scroll_direction: str) -> None:
         """
-        스크롤 제스처 처리 (PyAutoGUI 사용)
+        스크롤 제스처 처리
         
         Args:
             is_scrolling: 스크롤 상태
             scroll_direction: 스크롤 방향 ("up", "down", "left", "right")
         """
-        try:
-            if is_scrolling:
-                # 설정에서 스크롤 정도 가져오기
-                gesture_config = self.config_manager.get_gesture_config()
-                scroll_amount = gesture_config.get('scroll_amount', 5)
-                logger.info(f"스크롤 시도: {scroll_direction}, 양: {scroll_amount}")
+        if is_scrolling:
+            # 스크롤 정도 (설정 변경 시 update_config에서 갱신)
+            scroll_amount = self._scroll_amount
+            logger.info("스크롤 시도: %s, 양: %s", scroll_direction, scroll_amount)
+            
+            if scroll_direction == "up":
+                self._io_thread.submit("스크롤", native.scroll, 0, scroll_amount)
+                logger.info("위로 스크롤: %s", scroll_amount)
                 
-                if scroll_direction == "up":
-                    pyautogui.scroll(scroll_amount)
-                    logger.info(f"위로 스크롤: {scroll_amount}")
-                    
-                elif scroll_direction == "down":
-                    pyautogui.scroll(-scroll_amount)
-                    logger.info(f"아래로 스크롤: -{scroll_amount}")
-                    
-                elif scroll_direction == "left":
-                    pyautogui.hscroll(-scroll_amount)
-                    logger.info(f"왼쪽으로 스크롤: -{scroll_amount}")
-                    
-                elif scroll_direction == "right":
-                    pyautogui.hscroll(scroll_amount)
-                    logger.info(f"오른쪽으로 스크롤: {scroll_amount}")
+            elif scroll_direction == "down":
+                self._io_thread.submit("스크롤", native.scroll, 0, -scroll_amount)
+                logger.info("아래로 스크롤: -%s", scroll_amount)
                 
-                self.current_state.is_scrolling = True
-                self.current_state.scroll_direction = scroll_direction
-            elif not is_scrolling and self.current_state.is_scrolling:
-                self.current_state.is_scrolling = False
-                self.current_state.scroll_direction = ""
-                logger.debug("스크롤 상태 해제")
+            elif scroll_direction == "left":
+                self._io_thread.submit("스크롤", native.scroll, -scroll_amount, 0)
+                logger.info("왼쪽으로 스크롤: -%s", scroll_amount)
                 
-        except Exception as e:
-            logger.error(f"스크롤 처리 중 오류: {e}")
+            elif scroll_direction == "right":
+                self._io_thread.submit("스크롤", native.scroll, scroll_amount, 0)
+                logger.info("오른쪽으로 스크롤: %s", scroll_amount)
+            
+            self.current_state.is_scrolling = True
+            self.current_state.scroll_direction = scroll_direction
+        elif not is_scrolling and self.current_state.is_scrolling:
+            self.current_state.is_scrolling = False
+            self.current_state.scroll_direction = ""
+            logger.debug("스크롤 상태 해제")
     
     def _fallback_scroll(self, scroll_direction: str) -> None:
         """fallback 스크롤 (더 이상 사용하지 않음)"""
@@ -450,47 +573,20 @@ class MouseController:
             is_swiping: 스와이프 상태
             swipe_direction: 스와이프 방향 ("left", "right", "up", "down")
         """
-        try:
-            if is_swiping and not self.current_state.is_swiping:
-                # 맥북 제스처 단축키
-                if swipe_direction == "left":
-                    # 왼쪽으로 스와이프: 다음 데스크탑
-                    try:
-                        pyautogui.hotkey('ctrl', 'right')
-                        logger.info(f"스와이프 왼쪽 - 다음 데스크탑으로 이동 (성공)")
-                    except Exception as e:
-                        logger.error(f"스와이프 왼쪽 실패: {e}")
-                elif swipe_direction == "right":
-                    # 오른쪽으로 스와이프: 이전 데스크탑
-                    try:
-                        pyautogui.hotkey('ctrl', 'left')
-                        logger.info(f"스와이프 오른쪽 - 이전 데스크탑으로 이동 (성공)")
-                    except Exception as e:
-                        logger.error(f"스와이프 오른쪽 실패: {e}")
-                elif swipe_direction == "up":
-                    # 위로 스와이프: 미션 컨트롤 시작
-                    try:
-                        pyautogui.hotkey('ctrl', 'up')
-                        logger.info(f"스와이프 위 - 미션 컨트롤 시작 (성공)")
-                    except Exception as e:
-                        logger.error(f"스와이프 위 실패: {e}")
-                elif swipe_direction == "down":
-                    # 아래로 스와이프: 미션 컨트롤 종료
-                    try:
-                        pyautogui.hotkey('ctrl', 'down')
-                        logger.info(f"스와이프 아래 - 미션 컨트롤 종료 (성공)")
-                    except Exception as e:
-                        logger.error(f"스와이프 아래 실패: {e}")
-                
-                self.current_state.is_swiping = True
-                self.current_state.swipe_direction = swipe_direction
-            elif not is_swiping and self.current_state.is_swiping:
-                self.current_state.is_swiping = False
-                self.current_state.swipe_direction = ""
-                logger.debug("스와이프 상태 해제")
-                
-        except Exception as e:
-            logger.error(f"스와이프 처리 중 오류: {e}")
+        if is_swiping and not self.current_state.is_swiping:
+            # 맥북 제스처 단축키
+            action = _SWIPE_ACTIONS.get(swipe_direction)
+            if action is not None:
+                description, keys, message = action
+                self._io_thread.submit(description, native.hotkey, *keys)
+                logger.info(message)
+            
+            self.current_state.is_swiping = True
+            self.current_state.swipe_direction = swipe_direction
+        elif not is_swiping and self.current_state.is_swiping:
+            self.current_state.is_swiping = False
+            self.current_state.swipe_direction = ""
+            logger.debug("스와이프 상태 해제")
     
     def get_current_position(self) -> Tuple[int, int]:
         """
@@ -499,7 +595,7 @@ class MouseController:
         Returns:
             현재 마우스 x, y 좌표
         """
-        return pyautogui.position()
+        return native.get_position()
     
     def get_screen_size(self) -> Tuple[int, int]:
         """
@@ -513,26 +609,19 @@ class MouseController:
     def reset_state(self) -> None:
         """마우스 상태 초기화"""
         try:
-            self.current_state = MouseState(
-                x=0, y=0,
-                is_clicking=False,
-                is_right_clicking=False,
-                is_double_clicking=False,
-                is_scrolling=False,
-                is_swiping=False,
-                swipe_direction="",
-                scroll_direction=""
-            )
+            # 새 객체를 만들지 않고 필드만 초기화 (객체 참조 유지)
+            self.current_state.reset()
+            
+            # 대기 중인 마우스 입력 취소
+            if hasattr(self, '_io_thread'):
+                self._io_thread.clear()
             
             # 상대적 이동 초기화
-            self.prev_palm_x = None
-            self.prev_palm_y = None
+            self._prev_palm.fill(0.0)
             self.is_initialized = False
             
             # 부드러운 이동 변수 초기화
-            self.smoothed_x = 0.0
-            self.smoothed_y = 0.0
-            self.last_move_time = time.time()
+            self._smoothed.fill(0.0)
             
             logger.debug("마우스 상태가 초기화되었습니다.")
             
@@ -540,13 +629,18 @@ class MouseController:
             logger.error(f"마우스 상태 초기화 중 오류: {e}")
     
     def update_config(self) -> None:
-        """설정 업데이트"""
+        """
+        설정 업데이트 (캐시된 설정 값만 갱신)
+        
+        UI 스레드에서 호출되므로 트래킹/입력 실행 스레드가 사용하는
+        마우스 상태와 입력 큐는 초기화하지 않습니다.
+        """
         try:
             # 화면 크기 다시 가져오기 (화면 해상도 변경 시)
-            self.screen_width, self.screen_height = pyautogui.size()
-            
-            # 마우스 상태 초기화
-            self.reset_state()
+            self._set_screen_size(*native.screen_size())
+            gesture_config = self.config_manager.get_gesture_config()
+            self._scroll_amount = gesture_config.get('scroll_amount', 5)
+            self._io_thread.set_move_rate(gesture_config.get('move_rate_hz', 60))
             
             logger.info("마우스 컨트롤러 설정이 업데이트되었습니다.")
             
@@ -556,8 +650,9 @@ class MouseController:
     def cleanup(self) -> None:
         """리소스 정리"""
         try:
-            # 마우스 상태 초기화
+            # 마우스 상태 초기화 후 입력 실행 스레드 정지
             self.reset_state()
+            self._io_thread.stop()
             logger.info("마우스 컨트롤러 리소스가 정리되었습니다.")
             
         except Exception as e:
@@ -0,0 +1,68 @@
+"""
+Numeric mouse kernels for Hand Tracking Trackpad application.
+"""
+try:
+    from numba import njit
+except ImportError:
+    # numba가 없으면 순수 파이썬 함수로 실행
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def motion_step(prev_palm, smoothed, palm_x, palm_y, move_mode,
+                smoothing_factor, scale_x, scale_y, min_movement):
+    """
+    커서 이동량 계산 한 프레임 진행
+
+    Args:
+        prev_palm: 이전 손바닥 위치 (x, y) 배열 (제자리 갱신)
+        smoothed: 스무딩된 변화량 (x, y) 배열 (제자리 갱신)
+        palm_x, palm_y: 현재 손바닥 위치 (0~1)
+        move_mode: 이동 모드 여부 (아니면 위치만 갱신)
+        smoothing_factor: 지수 이동 평균 계수
+        scale_x, scale_y: 정규화 변화량 → 픽셀 이동량 배율 (감도 포함)
+        min_movement: 무시할 최소 변화량
+
+    Returns:
+        (x 이동 픽셀, y 이동 픽셀, 이동 여부)
+    """
+    delta_x = palm_x - prev_palm[0]
+    delta_y = palm_y - prev_palm[1]
+    prev_palm[0] = palm_x
+    prev_palm[1] = palm_y
+
+    if not move_mode:
+        return 0, 0, False
+
+    # 부드러운 스무딩 적용 (지수 이동 평균)
+    smoothed[0] = smoothed[0] * (1.0 - smoothing_factor) + delta_x * smoothing_factor
+    smoothed[1] = smoothed[1] * (1.0 - smoothing_factor) + delta_y * smoothing_factor
+
+    # 최소 이동량 임계값 (너무 작은 움직임 무시)
+    smoothed_x = smoothed[0]
+    smoothed_y = smoothed[1]
+    if abs(smoothed_x) < min_movement and abs(smoothed_y) < min_movement:
+        return 0, 0, False
+
+    # 0 방향으로 버림
+    return int(smoothed_x * scale_x), int(smoothed_y * scale_y), True
+
+
+@njit(cache=True)
+def clamp_position(x, y, max_x, max_y, margin):
+    """
+    커서 좌표를 화면 안 [margin, max - margin] 범위로 제한
+
+    Args:
+        x, y: 목표 커서 좌표
+        max_x, max_y: 화면의 마지막 픽셀 좌표 (너비 - 1, 높이 - 1)
+        margin: 가장자리 여유 픽셀
+
+    Returns:
+        (제한된 x, 제한된 y)
+    """
+    return (min(max(x, margin), max_x - margin),
+            min(max(y, margin), max_y - margin))
@@ -0,0 +1,284 @@
+"""
+Native mouse/keyboard input for Hand Tracking Trackpad application.
+
+pyautogui는 호출마다 PAUSE 대기와 failsafe 검사를 거치므로
+커서 이동, 클릭, 스크롤, 단축키 입력은 OS API를 직접 호출합니다.
+"""
+import sys
+from types import SimpleNamespace
+from typing import Tuple
+
+from utils.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 단축키에 사용하는 키 이름 (pyautogui 키 이름과 동일)
+_MODIFIER_KEYS = ('ctrl', 'shift', 'alt', 'command')
+_ARROW_KEYS = ('left', 'right', 'up', 'down')
+
+
+def _pyautogui_backend():
+    """pyautogui 대체 구현 (네이티브 API를 사용할 수 없는 경우)"""
+    import pyautogui
+    pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동하면 중단
+
+    def screen_size() -> Tuple[int, int]:
+        width, height = pyautogui.size()
+        return int(width), int(height)
+
+    def get_position() -> Tuple[int, int]:
+        x, y = pyautogui.position()
+        return int(x), int(y)
+
+    def move_to(x: int, y: int) -> None:
+        pyautogui.moveTo(x, y, _pause=False)
+
+    def click(button: str = 'left') -> None:
+        pyautogui.click(button=button, _pause=False)
+
+    def double_click(button: str = 'left') -> None:
+        pyautogui.doubleClick(button=button, _pause=False)
+
+    def scroll(dx: int, dy: int) -> None:
+        if dy:
+            pyautogui.scroll(dy, _pause=False)
+        if dx:
+            pyautogui.hscroll(dx, _pause=False)
+
+    def hotkey(*keys: str) -> None:
+        pyautogui.hotkey(*keys, _pause=False)
+
+    return SimpleNamespace(name='pyautogui', screen_size=screen_size, get_position=get_position,
+                           move_to=move_to, click=click, double_click=double_click,
+                           scroll=scroll, hotkey=hotkey)
+
+
+def _windows_backend():
+    """Windows: user32 커서/마우스/키보드 이벤트"""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    # pyautogui와 같이 DPI 인식 모드로 실제 픽셀 좌표 사용
+    user32.SetProcessDPIAware()
+    point = wintypes.POINT()
+
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+    MOUSEEVENTF_RIGHTDOWN = 0x0008
+    MOUSEEVENTF_RIGHTUP = 0x0010
+    MOUSEEVENTF_WHEEL = 0x0800
+    MOUSEEVENTF_HWHEEL = 0x1000
+    KEYEVENTF_EXTENDEDKEY = 0x0001
+    KEYEVENTF_KEYUP = 0x0002
+
+    button_flags = {
+        'left': (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP),
+        'right': (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP)
+    }
+    virtual_keys = dict(zip(_MODIFIER_KEYS + _ARROW_KEYS,
+                            (0x11, 0x10, 0x12, 0x5B, 0x25, 0x27, 0x26, 0x28)))
+
+    def screen_size() -> Tuple[int, int]:
+        return user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+
+    def get_position() -> Tuple[int, int]:
+        user32.GetCursorPos(ctypes.byref(point))
+        return point.x, point.y
+
+    def move_to(x: int, y: int) -> None:
+        user32.SetCursorPos(int(x), int(y))
+
+    def click(button: str = 'left') -> None:
+        down, up = button_flags[button]
+        user32.mouse_event(down, 0, 0, 0, 0)
+        user32.mouse_event(up, 0, 0, 0, 0)
+
+    def double_click(button: str = 'left') -> None:
+        click(button)
+        click(button)
+
+    def scroll(dx: int, dy: int) -> None:
+        # pyautogui와 같은 단위로 휠 값을 그대로 전달
+        if dy:
+            user32.mouse_event(MOUSEEVENTF_WHEEL, 0, 0, int(dy), 0)
+        if dx:
+            user32.mouse_event(MOUSEEVENTF_HWHEEL, 0, 0, int(dx), 0)
+
+    def key_event(key: str, flags: int) -> None:
+        if key in _ARROW_KEYS:
+            flags |= KEYEVENTF_EXTENDEDKEY
+        user32.keybd_event(virtual_keys[key], 0, flags, 0)
+
+    def hotkey(*keys: str) -> None:
+        for key in keys:
+            key_event(key, 0)
+        for key in reversed(keys):
+            key_event(key, KEYEVENTF_KEYUP)
+
+    return SimpleNamespace(name='user32', screen_size=screen_size, get_position=get_position,
+                           move_to=move_to, click=click, double_click=double_click,
+                           scroll=scroll, hotkey=hotkey)
+
+
+def _macos_backend():
+    """macOS: Quartz 이벤트 (커서 이동/단축키 이벤트 객체 재사용)"""
+    import Quartz
+
+    move_event = Quartz.CGEventCreateMouseEvent(
+        None, Quartz.kCGEventMouseMoved, (0, 0), Quartz.kCGMouseButtonLeft
+    )
+    button_events = {
+        'left': (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp, Quartz.kCGMouseButtonLeft),
+        'right': (Quartz.kCGEventRightMouseDown, Quartz.kCGEventRightMouseUp, Quartz.kCGMouseButtonRight)
+    }
+    key_codes = dict(zip(_MODIFIER_KEYS + _ARROW_KEYS,
+                         (0x3B, 0x38, 0x3A, 0x37, 0x7B, 0x7C, 0x7E, 0x7D)))
+    modifier_flags = dict(zip(_MODIFIER_KEYS, (
+        Quartz.kCGEventFlagMaskControl, Quartz.kCGEventFlagMaskShift,
+        Quartz.kCGEventFlagMaskAlternate, Quartz.kCGEventFlagMaskCommand
+    )))
+
+    def screen_size() -> Tuple[int, int]:
+        display_id = Quartz.CGMainDisplayID()
+        return Quartz.CGDisplayPixelsWide(display_id), Quartz.CGDisplayPixelsHigh(display_id)
+
+    def get_position() -> Tuple[int, int]:
+        location = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+        return int(location.x), int(location.y)
+
+    def move_to(x: int, y: int) -> None:
+        Quartz.CGEventSetLocation(move_event, (x, y))
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, move_event)
+
+    def post_click(button: str, click_state: int) -> None:
+        down, up, mouse_button = button_events[button]
+        location = Quartz.CGEventGetLocation(Quartz.CGEventCreate(None))
+        for event_type in (down, up):
+            event = Quartz.CGEventCreateMouseEvent(None, event_type, location, mouse_button)
+            Quartz.CGEventSetIntegerValueField(event, Quartz.kCGMouseEventClickState, click_state)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def click(button: str = 'left') -> None:
+        post_click(button, 1)
+
+    def double_click(button: str = 'left') -> None:
+        # 두 번째 클릭의 clickState를 2로 설정해야 더블클릭으로 인식됨
+        post_click(button, 1)
+        post_click(button, 2)
+
+    def scroll(dx: int, dy: int) -> None:
+        event = Quartz.CGEventCreateScrollWheelEvent(None, Quartz.kCGScrollEventUnitLine, 2, int(dy), int(dx))
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    def build_key_events(keys: Tuple[str, ...]) -> tuple:
+        flags = 0
+        for key in keys:
+            flags |= modifier_flags.get(key, 0)
+        events = []
+        for key_down, ordered_keys in ((True, keys), (False, tuple(reversed(keys)))):
+            for key in ordered_keys:
+                event = Quartz.CGEventCreateKeyboardEvent(None, key_codes[key], key_down)
+                Quartz.CGEventSetFlags(event, flags)
+                events.append(event)
+        return tuple(events)
+
+    # 스와이프 단축키(Ctrl+방향키) 이벤트는 미리 생성해 재사용
+    key_events = {('ctrl', arrow): build_key_events(('ctrl', arrow)) for arrow in _ARROW_KEYS}
+
+    def hotkey(*keys: str) -> None:
+        events = key_events.get(keys)
+        if events is None:
+            events = key_events[keys] = build_key_events(keys)
+        for event in events:
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+    return SimpleNamespace(name='quartz', screen_size=screen_size, get_position=get_position,
+                           move_to=move_to, click=click, double_click=double_click,
+                           scroll=scroll, hotkey=hotkey)
+
+
+def _x11_backend():
+    """Linux(X11): XTest 입력 이벤트"""
+    from Xlib import X, XK
+    from Xlib.display import Display
+    from Xlib.ext import xtest
+
+    display = Display()
+    root = display.screen().root
+    buttons = {'left': 1, 'right': 3}
+    key_codes = {
+        key: display.keysym_to_keycode(XK.string_to_keysym(keysym))
+        for key, keysym in zip(_MODIFIER_KEYS + _ARROW_KEYS,
+                               ('Control_L', 'Shift_L', 'Alt_L', 'Super_L', 'Left', 'Right', 'Up', 'Down'))
+    }
+
+    def screen_size() -> Tuple[int, int]:
+        screen = display.screen()
+        return screen.width_in_pixels, screen.height_in_pixels
+
+    def get_position() -> Tuple[int, int]:
+        pointer = root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def move_to(x: int, y: int) -> None:
+        xtest.fake_input(display, X.MotionNotify, x=int(x), y=int(y))
+        display.flush()
+
+    def press_button(button: int, count: int = 1) -> None:
+        for _ in range(count):
+            xtest.fake_input(display, X.ButtonPress, button)
+            xtest.fake_input(display, X.ButtonRelease, button)
+        display.flush()
+
+    def click(button: str = 'left') -> None:
+        press_button(buttons[button])
+
+    def double_click(button: str = 'left') -> None:
+        press_button(buttons[button], 2)
+
+    def scroll(dx: int, dy: int) -> None:
+        # 휠 버튼: 4 위, 5 아래, 6 왼쪽, 7 오른쪽 (한 칸당 한 번)
+        if dy:
+            press_button(4 if dy > 0 else 5, abs(int(dy)))
+        if dx:
+            press_button(7 if dx > 0 else 6, abs(int(dx)))
+
+    def hotkey(*keys: str) -> None:
+        for key in keys:
+            xtest.fake_input(display, X.KeyPress, key_codes[key])
+        for key in reversed(keys):
+            xtest.fake_input(display, X.KeyRelease, key_codes[key])
+        display.flush()
+
+    return SimpleNamespace(name='xtest', screen_size=screen_size, get_position=get_position,
+                           move_to=move_to, click=click, double_click=double_click,
+                           scroll=scroll, hotkey=hotkey)
+
+
+def _load_backend():
+    """현재 플랫폼의 입력 구현 선택"""
+    if sys.platform == 'win32':
+        loader = _windows_backend
+    elif sys.platform == 'darwin':
+        loader = _macos_backend
+    else:
+        loader = _x11_backend
+
+    try:
+        return loader()
+    except Exception as e:
+        logger.warning(f"네이티브 입력을 사용할 수 없어 pyautogui로 대체합니다: {e}")
+        return _pyautogui_backend()
+
+
+_backend = _load_backend()
+BACKEND = _backend.name
+screen_size = _backend.screen_size
+get_position = _backend.get_position
+move_to = _backend.move_to
+click = _backend.click
+double_click = _backend.double_click
+scroll = _backend.scroll
+hotkey = _backend.hotkey
+logger.info(f"마우스/키보드 입력 백엔드: {BACKEND}")
@@ -11,8 +11,6 @@ Version: 1.0.0
 
 import sys
 from pathlib import Path
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent
@@ -25,9 +23,27 @@ from exceptions.base import HandTrackpadError
 logger = get_logger(__name__)
 
 
+def set_timer_resolution(enabled: bool) -> None:
+    """Windows 타이머 해상도를 1ms로 설정/해제 (기본 ~15ms라 sleep 지터가 큼)"""
+    if sys.platform != "win32":
+        return
+    try:
+        import ctypes
+        if enabled:
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    except Exception as e:
+        logger.warning(f"타이머 해상도 설정 실패: {e}")
+
+
 def main():
     """메인 함수"""
     try:
+        # Qt는 실제로 앱을 실행할 때만 import
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QIcon
+        
         # QApplication 생성 (PyQt5 앱 아이콘 설정을 위해)
         qt_app = QApplication(sys.argv)
         
@@ -46,8 +62,12 @@ def main():
                 logger.warning("아이콘 파일을 찾을 수 없습니다.")
         
         # 애플리케이션 생성 및 실행
-        app = SkyTouchApp()
-        app.run()
+        set_timer_resolution(True)
+        try:
+            app = SkyTouchApp()
+            app.run()
+        finally:
+            set_timer_resolution(False)
         
     except KeyboardInterrupt:
         logger.info("사용자에 의해 애플리케이션이 중단되었습니다.")
@@ -84,12 +84,15 @@ class SettingsDialog(QDialog):
             self.config_manager.save_config()
             
             # 컴포넌트 설정 업데이트
+            self.app_logic.apply_debug_mode()
             if self.app_logic.camera_capture:
                 self.app_logic.camera_capture.update_config(cam_cfg)
             if self.app_logic.hand_detector:
                 self.app_logic.hand_detector.update_config(hand_cfg)
             if self.app_logic.gesture_detector:
                 self.app_logic.gesture_detector.update_config(gesture_cfg)
+            if self.app_logic.mouse_controller:
+                self.app_logic.mouse_controller.update_config()
             
             logger.info("설정이 저장되었습니다.")
             self.accept()
@@ -30,11 +30,6 @@ class CameraPanel(QWidget):
         # 카메라 관련 변수
         self.is_displaying = False
         self.display_thread = None
-        
-        # 컴포넌트 참조
-        self.hand_detector = app_logic.hand_detector
-        self.gesture_detector = app_logic.gesture_detector
-        self.mouse_controller = app_logic.mouse_controller
 
     def start_display(self):
         """카메라 표시 시작"""
@@ -57,36 +52,18 @@ class CameraPanel(QWidget):
 
     def display_loop(self):
         """카메라 표시 루프"""
+        # 고정 sleep 대신 perf_counter 기준 마감 시간까지만 대기 (처리 시간 보정)
+        display_fps = self.app_logic.config_manager.get_ui_config().get('display_fps', 30)
+        interval = 1.0 / max(1, display_fps)
+        next_deadline = time.perf_counter() + interval
         while self.is_displaying:
             frame = self.app_logic.get_camera_frame()
             if frame is not None:
-                # 1. 손 인식 (원본 프레임)
-                hand_landmarks_list = self.hand_detector.detect_hands(frame)
-                if hand_landmarks_list:
-                    for hand_landmarks in hand_landmarks_list:
-                        # 2. 랜드마크 그리기 (원본 프레임)
-                        frame = self.hand_detector.draw_landmarks(frame, hand_landmarks)
-                        # 3. 제스처 인식
-                        gesture_data = self.gesture_detector.detect_gestures(hand_landmarks)
-                        # 4. 마우스 제어
-                        self.mouse_controller.update_mouse_position(
-                            gesture_data.palm_center,
-                            gesture_mode=gesture_data.gesture_mode,
-                            smoothing=0.5,
-                            sensitivity=1.5,
-                            invert_x=False,
-                            invert_y=False
-                        )
-                        self.mouse_controller.handle_click(gesture_data.is_clicking)
-                        self.mouse_controller.handle_right_click(gesture_data.is_right_clicking)
-                        self.mouse_controller.handle_double_click(gesture_data.is_double_clicking)
-                        self.mouse_controller.handle_scroll(gesture_data.is_scrolling, gesture_data.scroll_direction)
-                        self.mouse_controller.handle_swipe(gesture_data.is_swiping, gesture_data.swipe_direction)
-                
-                # 3. 마지막에만 좌우반전
-                frame = np.fliplr(frame)
-                # 5. 화면 표시
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                # 마지막에만 좌우반전
+                flipped_frame = np.fliplr(frame)
+                # 화면 표시 (변환 후 원본 프레임 버퍼 반환)
+                rgb_frame = cv2.cvtColor(flipped_frame, cv2.COLOR_BGR2RGB)
+                self.app_logic.release_camera_frame(frame)
                 h, w, ch = rgb_frame.shape
                 bytes_per_line = ch * w
                 qt_img = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
@@ -99,12 +76,15 @@ class CameraPanel(QWidget):
                         Qt.SmoothTransformation
                     )
                 )
-            time.sleep(1/30)
+            
+            delay = next_deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 뒤처진 경우 몰아서 그리지 않고 기준 시간 재설정
+                next_deadline = time.perf_counter()
+            next_deadline += interval
         
-        # 루프 종료 시 초기 화면으로 복원 및 카메라 리소스 해제
+        # 루프 종료 시 초기 화면으로 복원
         self.camera_label.setText("카메라 화면")
-        self.camera_label.setPixmap(QPixmap())
-        # 카메라 리소스 해제 (스레드 종료 시)
-        if hasattr(self.app_logic, 'camera_capture') and self.app_logic.camera_capture:
-            self.app_logic.camera_capture.release()
-            logger.info("카메라 리소스가 해제되었습니다.") 
\ No newline at end of file
+        self.camera_label.setPixmap(QPixmap()) 
\ No newline at end of file
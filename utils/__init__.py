@@ -2,6 +2,6 @@
 Utility modules for Hand Tracking Trackpad application.
 """
 
-from .logging import get_logger, AppLogger
+from .logging import get_logger, AppLogger, set_log_level
 
-__all__ = ['get_logger', 'AppLogger'] 
\ No newline at end of file
+__all__ = ['get_logger', 'AppLogger', 'set_log_level'] 
\ No newline at end of file
@@ -31,7 +31,7 @@ def get_available_cameras(max_check: int = 10) -> List[Tuple[int, str]]:
                 camera_name = _generate_camera_name(device_id, cap)
                 available_cameras.append((device_id, camera_name))
                 cap.release()
-                logger.debug(f"카메라 {device_id} 발견: {camera_name}")
+                logger.debug("카메라 %s 발견: %s", device_id, camera_name)
             else:
                 # 더 이상 카메라가 없으면 중단
                 if device_id > 0:  # 첫 번째 카메라가 없으면 계속 시도
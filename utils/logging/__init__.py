@@ -2,6 +2,6 @@
 Logging utilities module.
 """
 
-from .logger import get_logger, AppLogger
+from .logger import get_logger, AppLogger, set_log_level
 
-__all__ = ['get_logger', 'AppLogger'] 
\ No newline at end of file
+__all__ = ['get_logger', 'AppLogger', 'set_log_level'] 
\ No newline at end of file
@@ -2,18 +2,46 @@
 Logging utilities for the Hand Tracking Trackpad application.
 """
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 
+def _level_from_env() -> int:
+    """SKYTOUCH_LOG_LEVEL 환경 변수의 로그 레벨 (없거나 잘못된 값이면 INFO)"""
+    level = logging.getLevelName(os.environ.get("SKYTOUCH_LOG_LEVEL", "INFO").upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+# 기본 로그 레벨 (환경 변수, 없으면 INFO) 및 현재 애플리케이션 로거 레벨
+_default_level = _level_from_env()
+_log_level = _default_level
+
+# AppLogger로 만든 로거 이름 (레벨 일괄 변경용)
+_app_logger_names = set()
+
+
+def set_log_level(level: Optional[int] = None) -> None:
+    """모든 애플리케이션 로거의 레벨 변경 (None이면 기본 레벨로 복원)"""
+    global _log_level
+    _log_level = _default_level if level is None else level
+    for name in _app_logger_names:
+        logging.getLogger(name).setLevel(_log_level)
+
+
 class AppLogger:
-    """애플리케이션 로거"""
+    """
+    애플리케이션 로거
+    
+    메시지 인자를 별도로 넘기면 (%-포맷) 해당 레벨이 비활성일 때 포맷을 생략합니다.
+    """
     
     def __init__(self, name: str = "HandTrackpad", log_file: Optional[str] = None):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(_log_level)
+        _app_logger_names.add(name)
         
         # 중복 핸들러 방지
         if not self.logger.handlers:
@@ -43,25 +71,29 @@ class AppLogger:
             file_handler.setFormatter(file_formatter)
             self.logger.addHandler(file_handler)
     
-    def debug(self, message: str) -> None:
+    def isEnabledFor(self, level: int) -> bool:
+        """해당 레벨 로그가 출력되는지 확인 (포맷 비용이 큰 로그 앞에서 사용)"""
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, message: str, *args) -> None:
         """디버그 로그"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, stacklevel=2)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """정보 로그"""
-        self.logger.info(message)
+        self.logger.info(message, *args, stacklevel=2)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """경고 로그"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, stacklevel=2)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """에러 로그"""
-        self.logger.error(message)
+        self.logger.error(message, *args, stacklevel=2)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """치명적 에러 로그"""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, stacklevel=2)
 
 
 # 전역 로거 인스턴스